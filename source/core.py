@@ -83,7 +83,7 @@ class actionObject(object):
         self._clearForReleaseFlag_ = threading.Event() #Indicates that the actionObject can be released from the channel priority queue and await transmission
         self._channelAccessGrantedFlag_ = threading.Event() #Indicates that the actionObject has been granted access to the channel in order to transmit
         
-        self._channelAccessLock_ = None     #On channel access this will be set to the channel access lock object (provided by the interface) by _grantChannelAccess_
+        self._channelReleaseFlag_ = None     #On channel access this will be set to the channel release flag object (provided by the interface) by _grantChannelAccess_
         
         self._inboundPacketFlag_ = threading.Event()
         
@@ -175,15 +175,24 @@ class actionObject(object):
         """Returns True if the actionObject has been cleared for release from the channel priority queue."""
         return self._clearForReleaseFlag_.is_set()
     
-    def _grantChannelAccess_(self, channelAccessLock = None):
+    def _waitForClearForRelease_(self, timeout = None):
+        """Blocks until the actionObject has been cleared for release from the channel priority queue.
+        
+        timeout -- the maximum time to wait in seconds, or None to wait indefinitely
+        
+        Returns True if the actionObject was cleared for release, or False if the timeout elapsed first.
+        """
+        return self._clearForReleaseFlag_.wait(timeout)
+    
+    def _grantChannelAccess_(self, channelReleaseFlag = None):
         """Grants the actionObject access to its interface's transmission channel.
         
-        channelAccessLock -- a threading.lock object that must be released by the actionObject when done using the channel.
+        channelReleaseFlag -- a threading.Event object that must be set by the actionObject when done using the channel.
         
-        Note that if the lock object is not released, transmission will block on the interface indefinitely. The transmit function will automatically release
+        Note that if the release flag is not set, transmission will block on the interface indefinitely. The transmit function will automatically release
         the channel access lock unless explicitly directed not to.
         """
-        self._channelAccessLock_ = channelAccessLock    #store a ref to the channel access lock
+        self._channelReleaseFlag_ = channelReleaseFlag    #store a ref to the channel release flag
         self._channelAccessGrantedFlag_.set()   #set the channel access flag, to indicate to another thread that the actionObject has channel access
         self.onChannelAccess()  #call the user-defined onChannelAccess method    
         
@@ -215,17 +224,17 @@ class actionObject(object):
             return False    #timeout
     
     def _releaseChannelAccessLock_(self):
-        """Releases the actionObject's channel access lock."""
-        if type(self._channelAccessLock_) != threading.Lock:    #check that channel access lock is the right type
-            try:
-                self._channelAccessLock_.release()  #attempt to release the lock
-                return True
-            except threading.ThreadError:   #channel access lock was already released
-                notice(self, "Channel access lock was already released on call to _releaseChannelAccessLock_.")
-                return False
-        else:   #channel acess lock is not of type threading.Lock. How did it get there? Or why wasn't it set?
+        """Releases the actionObject's channel access lock by setting the channel release flag provided by the interface."""
+        if isinstance(self._channelReleaseFlag_, threading.Event):    #check that channel release flag is the right type
+            self._channelReleaseFlag_.set()  #signal to the channel access thread that the channel has been released
+            self._channelReleaseFlag_ = None    #the release flag is good for only one release
+            return True
+        elif self.channelAccessIsGranted():   #channel access was granted, so the release flag has already been used
+            notice(self, "Channel access lock was already released on call to _releaseChannelAccessLock_.")
+            return False
+        else:   #channel release flag is not of type threading.Event. How did it get there? Or why wasn't it set?
             notice(self, "actionObject has no valid channel access lock on call to _releaseChannelAccessLock_")
-            notice(self, "Instead channel access lock type is " + str(type(self._channelAccessLock_)))
+            notice(self, "Instead channel release flag type is " + str(type(self._channelReleaseFlag_)))
             return False
     
     def releaseChannel(self):
@@ -247,15 +256,15 @@ class actionObject(object):
         Note that although a queue is used, only one actionObject resided there at a time. Its occupant will be signaled when a packet is received.
         """
         cls._getActionObjectFromInboundPacketFlagQueue_()  #pulls any still-resident actionObject from the queue
-        cls._inboundPacketFlagQueue_.put(actionObject) #put the provided actionObject into the queue
+        cls._inboundPacketFlagQueue_.append(actionObject) #put the provided actionObject into the queue
         return True
         
     @classmethod
     def _getActionObjectFromInboundPacketFlagQueue_(cls):
         """If avaliable, returns an actionObject from the inbound packet flag queue."""
         try:
-            return cls._inboundPacketFlagQueue_.get(block=False)  #pulls an actionObject from the inboundPacketFlagQueue
-        except:
+            return cls._inboundPacketFlagQueue_.popleft()  #pulls an actionObject from the inboundPacketFlagQueue
+        except (IndexError, AttributeError): #queue is empty, or the actionObject hasn't been bound to a port
             return False
     
     def transmit(self, mode = 'unicast', releaseChannelOnTransmit = True):
@@ -444,6 +453,15 @@ class actionSet(object):
         """Returns True if the actionSet has been cleared for release from the channel priority queue."""
         return self._clearForReleaseFlag_.is_set()        
 
+    def _waitForClearForRelease_(self, timeout = None):
+        """Blocks until the actionSet has been cleared for release from the channel priority queue.
+        
+        timeout -- the maximum time to wait in seconds, or None to wait indefinitely
+        
+        Returns True if the actionSet was cleared for release, or False if the timeout elapsed first.
+        """
+        return self._clearForReleaseFlag_.wait(timeout)
+
     def getActionMolecules(self):
         """Returns a list of all contained actionMolecules"""
         return self.actionMolecules
@@ -6,6 +6,8 @@
 #---- INCLUDES ----
 import threading
 import queue
+import collections
+import struct
 import time
 import copy
 import random   #for generating new addresses
@@ -55,6 +57,7 @@ class serialInterface(baseInterface):
         self.isConnectedFlag = threading.Event()    #keeps track of current status of interface
         self.isStartedFlag = threading.Event()  #keeps track of whether the interface has been started (connected and the transmitter thread running)
         self._threadIdleTime_ = 0.0005  #seconds, time for thread to idle between runs of loop
+        self._queueWaitTime_ = 0.1  #seconds, maximum time for a thread to block while waiting on an empty queue
         self._portReconnectTime_ = 5    #seconds, time between attempts to reconnect to a down port.
         
     def updateBaudrateIfDefault(self, newBaudrate):
@@ -89,15 +92,12 @@ class serialInterface(baseInterface):
         
         Returns the combined dictionary
         """
-        combinedDictionary = {}
-        for searchStringDictKey in searchStringDictionaries:
-            for operatingSystem in searchStringDictionaries[searchStringDictKey]:
-                if operatingSystem in combinedDictionary:   #operating sytem entry already exists in the combined dictionary
-                    combinedDictionary[operatingSystem] = combinedDictionary[operatingSystem] + searchStringDictionaries[searchStringDictKey][operatingSystem]   #append to existing list
-                else:   #new OS in combined dictionary
-                    combinedDictionary[operatingSystem] = searchStringDictionaries[searchStringDictKey][operatingSystem]
+        combinedDictionary = collections.defaultdict(list)  #new operating system entries start out as an empty list
+        for searchStringDictionary in searchStringDictionaries.values():
+            for operatingSystem, searchStrings in searchStringDictionary.items():
+                combinedDictionary[operatingSystem].extend(searchStrings)   #append to existing list
 
-        return combinedDictionary
+        return dict(combinedDictionary)
         
     def getPortSearchStrings(self, interfaceType = None):
         """Returns a list of likely prefixes for a serial port based on the operating system and provided device type information.
@@ -322,17 +322,20 @@ class serialInterface(baseInterface):
             notice(self, str(self.portPath)+ " is not connected!")
             return False
     
-    def receive(self):
-        """Reads one byte from the serial port input buffer.
+    def receive(self, size = 1):
+        """Reads bytes from the serial port input buffer.
+        
+        size -- the maximum number of bytes to read. Fewer bytes will be returned if the port times out first.
         
         Note that if a port is open, this function will block while waiting for a byte. If the serialInterface is the interface for a
-        gestaltInterface, there is a receive thread that doesn't mind blocking.
+        gestaltInterface, there is a receive thread that doesn't mind blocking. If the port is not connected, this function will block for
+        up to _queueWaitTime_ waiting for a connection, so that a receive thread doesn't spin while the port is down.
         """
-        if self.isConnected():
+        if self.isConnected() or self.isConnectedFlag.wait(self._queueWaitTime_):
             try:
-                return self.port.read(size = 1) #reads a single byte from the serial port. If empty will wait timeout period established on port instantiation, then returns ''
+                return self.port.read(size = size) #reads up to size bytes from the serial port. If empty will wait timeout period established on port instantiation, then returns ''
             except: #likely that port closed while waiting to receive
-                notice(self.interface, "Lost connection to serial port " + str(self.interface.portPath))
+                notice(self, "Lost connection to serial port " + str(self.portPath))
                 self.isConnectedFlag.clear()    #mark that port is closed. It will need to be reopened by the transmit thread.
                 return None
         else:
@@ -357,7 +360,7 @@ class serialInterface(baseInterface):
             """
             threading.Thread.__init__(self) #initialize threading parent class
             self.interface = interface  #a reference to serialInterface instance
-            self.transmitQueue = queue.Queue()  #Use a queue to permit background transmission, and to allow multiple threads to access the interface.
+            self.transmitQueue = queue.SimpleQueue()  #Use a queue to permit background transmission, and to allow multiple threads to access the interface.
         
         def run(self):
             """Transmitter thread loop.
@@ -373,18 +376,17 @@ class serialInterface(baseInterface):
                         except: #Fixed encoding exception. IF THIS EXCEPTS, MIGHT WANT TO ADD A WAY TO RETRANSMIT THE PACKET. GETS HAIRY.
                             self.interface.isConnectedFlag.clear() #port is no longer connected
                             notice(self.interface, "Lost connection to serial port " + str(self.interface.portPath))
-                    time.sleep(self.interface._threadIdleTime_) #idle
                 else:   #port isn't connected, attempt to reconnect
                     time.sleep(self.interface._portReconnectTime_)
                     self.interface.connect()    #attempt to reconnect         
         
         def getPacketFromTransmitQueue(self):
-            """Attempts to pull a packet from the transmit queue.
+            """Attempts to pull a packet from the transmit queue, blocking for up to _queueWaitTime_ if the queue is empty.
             
             Returns (True, packet) if data is waiting in the queue to be transmitted, or (False, None) if not.
             """
             try:
-                return True, self.transmitQueue.get(block = False)    #signal success, return packet
+                return True, self.transmitQueue.get(block = True, timeout = self.interface._queueWaitTime_)    #signal success, return packet
             except queue.Empty:
                 return False, None  #signal failure, return None  
         
@@ -420,9 +422,13 @@ class gestaltInterface(baseInterface):
         self._nodeAddressTable_ = {}    #{virtualNode:address} pairs for outbound transmissions
         self._addressNodeTable_ = {}     #{address:virtualNode} pairs for inbound transmissions
         self._shellNodeTable_ = {}          #maintains associations between virtual node shells and their contained nodes
+        self._nodeTableLock_ = threading.RLock()    #serializes changes to the node, address, and shell tables. Reentrant because attachNode calls _updateNode_.
         self._addressRangeMin_ = 1          #Reserve address 0.
         self._addressRangeMax_ = 65535      #maximum address value for gestalt nodes is 16-bit.
         self._threadIdleTime_ = 0.0005      #seconds, time for thread to idle between runs of loop
+        self._queueWaitTime_ = 0.1          #seconds, maximum time for a thread to block while waiting on an empty queue
+        self._queueBatchSize_ = 64          #maximum number of items a thread will pull from its queue in a single pass
+        self._maxQueueDepth_ = 1024         #maximum number of items held in the channel priority and router queues
         
         self._gestaltPacket_ = packets.template('gestaltPacketTemplate',
                                               packets.unsignedInt('_startByte_',1), #start byte, 72 for unicast, 138 for multicast
@@ -432,6 +438,11 @@ class gestaltInterface(baseInterface):
                                               packets.packet('_payload_'), #included packet
                                               packets.checksum('_checksum_')) #automatically calculated checksum
         
+        # Precompiled encoder for outbound packets, matching the layout of _gestaltPacket_
+        self._gestaltPacketHeader_ = struct.Struct('<BHBB')   #startByte, address (LSB first), port, length
+        self._gestaltPacketCRC_ = utilities.CRC(7)  #same polynomial as the _checksum_ token
+        self._startBytes_ = {'unicast':72, 'multicast':138}    #start byte for each transmission mode
+        
         if self._interface_: self._interface_.start()   #start up whatever downstream interface was provided.
         self._startInterfaceThreads_()  #start up interface threads 
 
@@ -503,8 +514,9 @@ class gestaltInterface(baseInterface):
         currentNode -- the currently attached virtual node instance
         newNode -- the virtual node instance to replace the current node
         """
-        address = self._nodeAddressTable_.pop(currentNode) #remove current node from node:address table
-        self._updateNode_(newNode, address)   #updates the node address map
+        with self._nodeTableLock_:
+            address = self._nodeAddressTable_.pop(currentNode) #remove current node from node:address table
+            self._updateNode_(newNode, address)   #updates the node address map
     
     def _updateNode_(self, virtualNode, address):
         """Updates entries in the node:address and address:node tables.
@@ -514,8 +526,9 @@ class gestaltInterface(baseInterface):
         
         This function will most often be used to create new node-address mappings, but can also be used to simply update.
         """
-        self._nodeAddressTable_.update({virtualNode:address})   #insert new node into node:address table
-        self._addressNodeTable_.update({address:virtualNode})
+        with self._nodeTableLock_:  #readers use single dict lookups, so only writers need to hold the lock
+            self._nodeAddressTable_[virtualNode] = address   #insert new node into node:address table
+            self._addressNodeTable_[address] = virtualNode
     
     def setPersistenceManager(self, persistenceManager):
         """Sets the interface's persistence manager to the provided utilities.persistenceManager object.
@@ -538,29 +551,30 @@ class gestaltInterface(baseInterface):
         newAddress -- the value of the new address, or False if no new address was necessary. A new address might not be necessary
                       if either the node object is being replaced, or if the address is stored persistently.
         """
-        if virtualNode._shell_ and (virtualNode._shell_ in self._shellNodeTable_):
-            #The shell has already been affiliated with an attched node in the past, implying that the new attach request
-            #is coming from an updated virtual node. So no new address should be pulled, just need to replace references
-            #to the current node with references from the new node.
-            oldVirtualNode = self._shellNodeTable_[virtualNode._shell_]
-            self._replaceNode_(currentNode = oldVirtualNode, newNode = virtualNode) #replace node-address mapping
-            newAddress = False #no new address
-            
-        else:
-            persistentAddress = self._getNodePersistentAddress_(virtualNode)
-            if type(persistentAddress) == int: 
-                #a valid new address was successfully retrieved from persistence manager.
-                self._updateNode_(virtualNode, persistentAddress) #set the recalled address of the node in the node-address maps
+        with self._nodeTableLock_:  #the lookup, address assignment, and table updates must happen as one step, so two nodes can't pull the same address
+            if virtualNode._shell_ and (virtualNode._shell_ in self._shellNodeTable_):
+                #The shell has already been affiliated with an attched node in the past, implying that the new attach request
+                #is coming from an updated virtual node. So no new address should be pulled, just need to replace references
+                #to the current node with references from the new node.
+                oldVirtualNode = self._shellNodeTable_[virtualNode._shell_]
+                self._replaceNode_(currentNode = oldVirtualNode, newNode = virtualNode) #replace node-address mapping
                 newAddress = False #no new address
+            
             else:
-                #unable to retrieve an address, so a new one needs to be assigned.
-                newAddress = self._pullNewAddress_()    #unable to retrieve an address, so pull a new one.
-                self._setNodePersistentAddress_(virtualNode, newAddress) #try to store new address
-                self._updateNode_(virtualNode, newAddress) #set new address in the node-address maps
-                newAddress = self._nodeAddressTable_[virtualNode]
-            
-        self._shellNodeTable_.update({virtualNode._shell_:virtualNode}) #update shell node table
-        return newAddress
+                persistentAddress = self._getNodePersistentAddress_(virtualNode)
+                if type(persistentAddress) == int: 
+                    #a valid new address was successfully retrieved from persistence manager.
+                    self._updateNode_(virtualNode, persistentAddress) #set the recalled address of the node in the node-address maps
+                    newAddress = False #no new address
+                else:
+                    #unable to retrieve an address, so a new one needs to be assigned.
+                    newAddress = self._pullNewAddress_()    #unable to retrieve an address, so pull a new one.
+                    self._setNodePersistentAddress_(virtualNode, newAddress) #try to store new address
+                    self._updateNode_(virtualNode, newAddress) #set new address in the node-address maps
+                    newAddress = self._nodeAddressTable_[virtualNode]
+            
+            self._shellNodeTable_.update({virtualNode._shell_:virtualNode}) #update shell node table
+            return newAddress
     
     
     def _startInterfaceThreads_(self):
@@ -572,27 +586,42 @@ class gestaltInterface(baseInterface):
         channelAccessThread - actionObjects waiting to transmit on the interface are monitored here.
         receiver - puts together incoming packets from bytes received on the interface
         packetRouter - once a packet has been fully received, this thread ... [NOTE: fill in details here]
+        
+        The receiver thread only has work to do when a downstream interface exists, and the synthetic response thread only when
+        a node is running in synthetic mode. Both are created here so that their queues exist, but the receiver is only started
+        if a downstream interface was provided, and the synthetic response thread is started on its first use.
         """
         self._channelPriority_ = self._startThreadAsDaemon_(self._channelPriorityThread_)
         self._channelAccess_ = self._startThreadAsDaemon_(self._channelAccessThread_)
-        self._syntheticResponse_ = self._startThreadAsDaemon_(self._syntheticResponseThread_)
-        self._receiver_ = self._startThreadAsDaemon_(self._receiveThread_)
-        self._packetRouter_ = self._startThreadAsDaemon_(self._packetRouterThread_)
+        self._syntheticResponse_ = self._createDaemonThread_(self._syntheticResponseThread_)  #started on demand by putInSyntheticQueue
+        self._packetRouter_ = self._startThreadAsDaemon_(self._packetRouterThread_)   #must exist before the receiver starts, since the receiver feeds it
+        self._receiver_ = self._createDaemonThread_(self._receiveThread_)
+        if self._interface_: self._receiver_.startOnce() #only listen if there is something to listen to
 
 
-    def _startThreadAsDaemon_(self, threadClass):
-        """Creates an instance of the provided thread class and starts it as a daemon.
+    def _createDaemonThread_(self, threadClass):
+        """Creates an instance of the provided thread class as a daemon, without starting it.
         
         threadClass -- the thread class to be instantiated
         
-        Returns the running instance.
+        Returns the thread instance.
         
-        Note that this function is designed to be used to start interface threads, and will thus automatically pass
+        Note that this function is designed to be used to create interface threads, and will thus automatically pass
         a self-reference to the thread's __init__.
         """
         threadInstance = threadClass(interface = self)  #create instance of thread
         threadInstance.daemon = True    #set thread instance as daemon, so that the python interpreter can end without needing to kill the thread first
-        threadInstance.start()  #start the thread instance
+        return threadInstance   #return the thread instance
+
+    def _startThreadAsDaemon_(self, threadClass):
+        """Creates an instance of the provided thread class and starts it as a daemon.
+        
+        threadClass -- the thread class to be instantiated
+        
+        Returns the running instance.
+        """
+        threadInstance = self._createDaemonThread_(threadClass)  #create instance of thread
+        threadInstance.startOnce()  #start the thread instance
         return threadInstance   #return the thread instance
         
         
@@ -605,11 +634,45 @@ class gestaltInterface(baseInterface):
             """Initializes thread and stores a reference to the interface."""
             threading.Thread.__init__(self)
             self.interface = interface
+            self._startLock_ = threading.Lock() #guards against two callers starting the thread at once
+            self._isStarted_ = False
             self.init()
         
+        def startOnce(self):
+            """Starts the thread if it hasn't already been started.
+            
+            Unlike threading.Thread.start, this is safe to call repeatedly and from multiple threads.
+            """
+            if self._isStarted_: return #fast path once running
+            with self._startLock_:
+                if not self._isStarted_:
+                    self.start()
+                    self._isStarted_ = True
+        
         def init(self):
             """Dummy init function to be overriden by derived class."""
             pass
+        
+        def drainQueue(self, sourceQueue):
+            """Pulls a batch of items from a queue, blocking for up to _queueWaitTime_ if the queue is empty.
+            
+            sourceQueue -- the queue.Queue or queue.SimpleQueue object to drain.
+            
+            After the first item arrives, up to _queueBatchSize_ - 1 additional items are pulled without blocking. This lets a burst
+            of queued items be handled in one pass of the thread loop.
+            
+            Returns a list of the pulled items, which is empty if nothing arrived before the timeout.
+            """
+            try:
+                batch = [sourceQueue.get(block = True, timeout = self.interface._queueWaitTime_)]   #wait for the first item
+            except queue.Empty:
+                return []   #nothing arrived
+            try:
+                while len(batch) < self.interface._queueBatchSize_:
+                    batch.append(sourceQueue.get_nowait()) #pull any additional items that are already waiting
+            except queue.Empty:
+                pass
+            return batch
     
     class _channelPriorityThread_(_interfaceThread_):
         """Manages actionObjects that are queued for release to the channel access thread.
@@ -622,7 +685,7 @@ class gestaltInterface(baseInterface):
         """
         def init(self):
             """Initializes the channel priority thread."""
-            self.channelPriorityQueue = queue.Queue()   #create the channel priority queue
+            self.channelPriorityQueue = queue.Queue(maxsize = self.interface._maxQueueDepth_)   #create the channel priority queue. Bounded, so that producers wait rather than grow memory without limit.
         
         def run(self):
             """The channel priority thread loop.
@@ -633,24 +696,17 @@ class gestaltInterface(baseInterface):
             channel access queue. 
             """
             while True: #repeat forever
-                pending, actionMolecule = self.getActionMolecule() #get the next actionObject (or actionSet, or actionSequence) from the queue.
-                if pending: #an actionMolecule is waiting in the queue
-                    while not actionMolecule._isClearForRelease_():    #wait for the actionMolecule to be cleared for release from the queue
-                        time.sleep(self.interface._threadIdleTime_)  #idle
+                for actionMolecule in self.getActionMolecules(): #get all pending actionObjects (or actionSets, or actionSequences) from the queue, in order.
+                    actionMolecule._waitForClearForRelease_()    #block until the actionMolecule is cleared for release from the queue
                     for actionObject in self.serializeActionMolecule(actionMolecule):   #serialize actionMolecule into actionObjects, and iterate over them
                         self.releaseActionObject(actionObject)  #put actionObject into the channel access queue
-                else:
-                    time.sleep(self.interface._threadIdleTime_) #idle
                 
-        def getActionMolecule(self):
-            """Attempts to pull an actionMolecule from the channel priority queue.
+        def getActionMolecules(self):
+            """Pulls a batch of actionMolecules from the channel priority queue, blocking for up to _queueWaitTime_ if the queue is empty.
             
-            Returns (True, actionMolecule) if an actionMolecule was waiting in the queue, or (False, None) if not.
+            Returns a list of actionMolecules in the order they were queued, or an empty list if none were waiting.
             """
-            try:
-                return True, self.channelPriorityQueue.get(block = False)    #signal success, return actionMolecule
-            except queue.Empty:
-                return False, None  #signal failure, return None
+            return self.drainQueue(self.channelPriorityQueue)
         
         def putActionMolecule(self, actionMolecule):
             """Places actionMolecules into the channel priority queue.
@@ -659,6 +715,8 @@ class gestaltInterface(baseInterface):
             
             An actionMolecule is either simply an actionObject of type core.actionObject, or a collection of actionObjects in the 
             form of actionSets and actionSequences.
+            
+            If the queue is full, this will block until there is room. actionMolecules are never dropped.
             """
             self.channelPriorityQueue.put(actionMolecule)
             return True
@@ -711,9 +769,8 @@ class gestaltInterface(baseInterface):
         """
         def init(self):
             """Initialization routine for the channel access thread."""
-            self.channelAccessQueue = queue.Queue() #instantiate a queue for holding actionObjects awaiting channel access.
-            self.channelAccessLock = threading.Lock()   #creates a lock object used to hand off access to an actionObject
-            self.channelAccessLock.acquire()    #lock the lock object
+            self.channelAccessQueue = queue.SimpleQueue() #instantiate a queue for holding actionObjects awaiting channel access.
+            self.channelReleaseFlag = threading.Event()   #creates a flag that an actionObject sets to hand channel access back to this thread
         
         def run(self):
             """The channel access thread loop.
@@ -731,18 +788,17 @@ class gestaltInterface(baseInterface):
             while True:
                 pending, actionObject = self.getActionObject()  #get the next action object from the queue
                 if pending:
+                    self.channelReleaseFlag.clear()     #clear any stale release before handing off the channel
                     self.grantChannelAccess(actionObject)      #grant channel access to the actionObject
-                    self.channelAccessLock.acquire()    #wait for actionObject to release the channel before continuing
-                else:
-                    time.sleep(self.interface._threadIdleTime_) #idle
+                    self.channelReleaseFlag.wait()    #wait for actionObject to release the channel before continuing
         
         def getActionObject(self):
-            """Attempts to pull an actionObject from the channel access queue.
+            """Attempts to pull an actionObject from the channel access queue, blocking for up to _queueWaitTime_ if the queue is empty.
             
             Returns (True, actionObject) if an actionObject was waiting in the queue, or (False, None) if not.
             """
             try:
-                return True, self.channelAccessQueue.get(block = False)    #signal success, return actionObject
+                return True, self.channelAccessQueue.get(block = True, timeout = self.interface._queueWaitTime_)    #signal success, return actionObject
             except queue.Empty:
                 return False, None  #signal failure, return None            
             
@@ -762,20 +818,43 @@ class gestaltInterface(baseInterface):
             
             Granting channel access accomplishes three purposes:
             1) Notifies the actionObject that it has control of the channel.
-            2) Transfers the channel access lock to the actionObject, who will release when done.
+            2) Transfers the channel release flag to the actionObject, who will set it when done.
             3) Will run any immediate transmission routine in the current thread.
             """
-            actionObject._grantChannelAccess_(self.channelAccessLock)    #grant channel access to the actionObject, and pass along the access lock                
+            actionObject._grantChannelAccess_(self.channelReleaseFlag)    #grant channel access to the actionObject, and pass along the release flag                
     
     def _getAddressOfVirtualNode_(self, virtualNode):
         """Returns the address of a provided virtual node.
         
         virtualNode -- the virtualNode instance whose address needs to be looked up.
         """
-        if virtualNode in self._nodeAddressTable_:
-            return self._nodeAddressTable_[virtualNode]
-        else:
-            return False
+        return self._nodeAddressTable_.get(virtualNode, False)   #single lookup; False if the node isn't attached
+    
+    def _encodeGestaltPacket_(self, startByte, address, port, payload):
+        """Encodes an outbound packet without walking the general-purpose template encoder.
+        
+        startByte -- 72 for unicast, 138 for multicast
+        address -- the destination node address
+        port -- the destination service routine port
+        payload -- the already-encoded payload, as a flat sequence of bytes
+        
+        Returns a packets.serializedPacket identical to what self._gestaltPacket_.encode would produce.
+        """
+        encodedPacket = bytearray(self._gestaltPacketHeader_.pack(startByte, address, port, self._gestaltPacketHeader_.size + len(payload)))
+        encodedPacket += bytearray(payload)
+        encodedPacket.append(self._gestaltPacketCRC_.generate(encodedPacket))  #checksum covers everything before it
+        return packets.serializedPacket(encodedPacket, self._gestaltPacket_)
+    
+    def _decodeGestaltPacket_(self, packetBuffer):
+        """Decodes a complete gestalt packet without walking the general-purpose template decoder.
+        
+        packetBuffer -- the complete packet, as a bytearray or bytes. The checksum is not validated here.
+        
+        Returns a decoded packet dictionary identical to what self._gestaltPacket_.decode would produce.
+        """
+        startByte, address, port, length = self._gestaltPacketHeader_.unpack_from(packetBuffer)
+        return {'_startByte_':startByte, '_address_':address, '_port_':port, '_length_':length,
+                '_payload_':packets.serializedPacket(packetBuffer[self._gestaltPacketHeader_.size:-1]), '_checksum_':packetBuffer[-1]}
     
     def transmit(self, actionObject, mode):
         """Transmits a provided actionObject's packet over the interface.
@@ -788,21 +867,24 @@ class gestaltInterface(baseInterface):
         port = actionObject.virtualNode._getPortNumber_(actionObject)
         address = self._getAddressOfVirtualNode_(actionObject.virtualNode)
         payload = actionObject._getEncodedOutboundPacket_()
-        try:
-            startByte = {'unicast':72, 'multicast':138}[mode]
-        except:
+        startByte = self._startBytes_.get(mode)
+        if startByte is None:   #mode is not in the start byte table
             notice(self, "Transmission mode '" + str(mode) + "' is not valid.")
             return False
-        packetEncodeDictionary = {'_startByte_':startByte, '_address_':address, '_port_':port, '_payload_':payload} #establish the encode dictionary
-        encodedPacket = self._gestaltPacket_.encode(packetEncodeDictionary) #encode the complete outgoing packet
-        
-        actionObjectName = type(actionObject).__name__
-        debugNotice(None, 'comm', "--- OUTGOING PACKET FROM '" + actionObjectName + "' ---", padding = True)
-        debugNotice(None, 'comm', mode.upper() +" To Address " + str(utilities.unsignedIntegerToBytes(address, 2)) + " on Port "+ str(port))
-        debugNotice(None, 'comm', "ENCODED AS " + str(encodedPacket))
-        
-        if actionObject.virtualNode._isInSyntheticMode_():   #return a synthetic response
-            return self._syntheticResponse_.putInSyntheticQueue(encodedPacket = encodedPacket, syntheticResponseFunction = actionObject._synthetic_)
+        syntheticMode = actionObject.virtualNode._isInSyntheticMode_()
+        commDebug = utilities.debugEnabled('comm')  #only build the debug strings if they will be printed
+        if not syntheticMode or commDebug:  #synthetic packets never leave the interface, so only encode them to display
+            encodedPacket = self._encodeGestaltPacket_(startByte, address, port, payload) #encode the complete outgoing packet
+        
+        if commDebug:
+            actionObjectName = type(actionObject).__name__
+            debugNotice(None, 'comm', "--- OUTGOING PACKET FROM '" + actionObjectName + "' ---", padding = True)
+            debugNotice(None, 'comm', mode.upper() +" To Address " + str(utilities.unsignedIntegerToBytes(address, 2)) + " on Port "+ str(port))
+            debugNotice(None, 'comm', "ENCODED AS " + str(encodedPacket))
+        
+        if syntheticMode:   #return a synthetic response
+            decodedPacket = {'_startByte_':startByte, '_address_':address, '_port_':port, '_payload_':payload}  #what the synthetic node would decode
+            return self._syntheticResponse_.putInSyntheticQueue(decodedPacket = decodedPacket, syntheticResponseFunction = actionObject._synthetic_)
         else:   #not running in synthetic mode, so pass along the packet to the transmitter
             return self._interface_.transmit(encodedPacket)
             
@@ -812,8 +894,8 @@ class gestaltInterface(baseInterface):
         
         The purpose of this thread is to simulate the communications behavior of a physical node combined with the receiver thread.
         This is accomplished by the following process:
-        1) A tuple of format (encodedOutboundPacket, syntheticResponseFunction) is placed into the synthetic response queue by the putInSyntheticQueue method.
-        2) The encodedOutboundPacket will be decoded here to retrieve the outbound payload
+        1) A tuple of format (decodedOutboundPacket, syntheticResponseFunction) is placed into the synthetic response queue by the putInSyntheticQueue method.
+        2) The outbound payload is pulled from decodedOutboundPacket. Because the packet never leaves the interface, it is not encoded and decoded along the way.
         3) This thread will call syntheticResponseFunction - typically the _synthetic_ method of an actionObject - with the outbound payload as an argument.
         4) syntheticResponseFunction will return an encoded response payload.
         5) The response payload is placed back in the decoded outbound packet dictionary, which is then passed along to the packet router thread as if it had
@@ -822,7 +904,7 @@ class gestaltInterface(baseInterface):
         """
         def init(self):
             """Synthetic node thread initialization method."""
-            self.syntheticResponseQueue = queue.Queue()
+            self.syntheticResponseQueue = queue.SimpleQueue()
         
         def run(self):
             """Synthetic response thread loop."""
@@ -830,43 +912,46 @@ class gestaltInterface(baseInterface):
                 pending, syntheticTuple = self.getSyntheticTuple()  #get from the queue the next tuple containing information to generate a synthetic packet
                 if pending: #a tuple was waiting
                     #TODO: handle multicast packets
-                    encodedOutboundPacket, syntheticResponseFunction = syntheticTuple   #break apart stored tuple
-                    decodedOutboundPacket = self.interface._gestaltPacket_.decode(encodedOutboundPacket)[0]    #decode the outgoing packet
+                    decodedOutboundPacket, syntheticResponseFunction = syntheticTuple   #break apart stored tuple
                     outboundPayload = decodedOutboundPacket['_payload_']  #get the outbound payload from the decoded outbound packet
                     syntheticInboundPayload = syntheticResponseFunction(outboundPayload) #generate an encoded inbound payload
                     if syntheticInboundPayload != None: #a synthetic payload was provided by the node
                         decodedSyntheticInboundPacket = copy.copy(decodedOutboundPacket)    #make a copy of the decoded outbound packet to use as an inbound packet
                         decodedSyntheticInboundPacket.update({'_payload_':syntheticInboundPayload}) #swap the outbound payload for the new synthetized payload
                         self.interface._packetRouter_.putDecodedPacket(decodedSyntheticInboundPacket)   #put the decoded inbound packet into the packet router queue
-                else:
-                    time.sleep(self.interface._threadIdleTime_) #idle
 
         def getSyntheticTuple(self):
-            """Attempts to pull a tuple from the synthetic response queue.
+            """Attempts to pull a tuple from the synthetic response queue, blocking for up to _queueWaitTime_ if the queue is empty.
             
             Returns (True, tuple) if a tuple was waiting in the queue, or (False, None) if not.
             """
             try:
-                return True, self.syntheticResponseQueue.get(block = False)    #signal success, return tuple
+                return True, self.syntheticResponseQueue.get(block = True, timeout = self.interface._queueWaitTime_)    #signal success, return tuple
             except queue.Empty:
                 return False, None  #signal failure, return None            
             
-        def putInSyntheticQueue(self, encodedPacket, syntheticResponseFunction):
+        def putInSyntheticQueue(self, decodedPacket, syntheticResponseFunction):
             """Places objects into the synthetic response queue.
             
-            encodedPacket -- a fully encoded packet just as it would be transmitted
+            decodedPacket -- the outbound packet in decoded dictionary form, containing at least _address_, _port_, and _payload_
             syntheticResponseFunction -- the function that will be used to generate a synthetic response, typically of type actionObject._synthetic_
             """
-            self.syntheticResponseQueue.put((encodedPacket, syntheticResponseFunction))
+            self.syntheticResponseQueue.put((decodedPacket, syntheticResponseFunction))
+            self.startOnce()    #the synthetic response thread only runs once a synthetic packet has been generated
             return True
                  
     
     class _receiveThread_(_interfaceThread_):
         """Receives a incoming packet over the interface channel and when complete places the packet in the packet router queue."""
         
+        def init(self):
+            self.inProcessPacket = bytearray()  #single receive buffer, reused for every inbound packet
+        
         def resetReceiverState(self):
-            self.inProcessPacket = []    #initialize the currently received packet
-            self.packetReceiveState = 'waitingOnStartByte'
+            """Empties the receive buffer and returns the receiver to waiting on a start byte."""
+            del self.inProcessPacket[:]    #empty the receive buffer in place rather than allocating a new one
+            self.packetReceiveState = self.receiveStartByte   #the handler for the next bytes to arrive
+            self.bytesExpected = 1  #the buffer length at which the current handler can act
             self.packetLength = 0
         
         def validateAndDecodeInProcessPacket(self):
@@ -874,78 +959,103 @@ class gestaltInterface(baseInterface):
             
             returns the decoded packet in dictionary format if successful, or False if validation or decoding were unsuccessful
             """
-            packet = packets.serializedPacket(self.inProcessPacket)   #convert to a packets.serializedPacket object
-            if self.interface._gestaltPacket_.validateChecksum('_checksum_', packet): #checksum validates
-                decodedPacket = self.interface._gestaltPacket_.decode(packet)[0]
-                return decodedPacket
+            providedChecksum = self.inProcessPacket[-1] #the _checksum_ token is always the last byte of a gestalt packet
+            with memoryview(self.inProcessPacket) as packetView:   #view is released on exit, so the receive buffer can be resized again
+                calculatedChecksum = self.interface._gestaltPacketCRC_.generate(packetView[:-1])  #CRC of everything preceding the checksum, without copying
+            if calculatedChecksum == providedChecksum: #checksum validates
+                return self.interface._decodeGestaltPacket_(self.inProcessPacket)  #the payload is copied out, so the receive buffer can be reused
             else:
                 return False
+
+        def receiveStartByte(self, receivedBytes, commDebug):
+            """Receiver state handler while waiting on the start byte.
             
+            receivedBytes -- a bytearray of the bytes just appended to self.inProcessPacket
+            commDebug -- True if debug output on the 'comm' channel is enabled
+            """
+            startByte = self.inProcessPacket[0] #the start byte is the first byte of the packet
+            if commDebug: utilities.debugNotice(None, 'comm', "--- RECEIVER TRIGGERED ---", padding = True)
+            if (startByte == 72 or startByte == 138):   #start byte is valid
+                if commDebug:
+                    utilities.debugNotice(None, 'comm', "Incoming " + {72:'UNICAST', 138:'MULTICAST'}[startByte] + " Packet")
+                    utilities.debugNotice(None, 'comm', "[Receiver State: waitingOnLengthByte]")
+                self.packetReceiveState = self.receiveHeader   #put receiver in next state: wait for the rest of the header
+                self.bytesExpected = self.headerSize
+            else:
+                if commDebug:
+                    utilities.debugNotice(None, 'comm', "Start Byte " + str(startByte) + " Not Recognized")
+                    utilities.debugNotice(None, 'comm', "--- RECEIVER RESET ---")
+                self.resetReceiverState() #reset the receiver state, and begin listening again
+        
+        def receiveHeader(self, receivedBytes, commDebug):
+            """Receiver state handler while waiting on the header up through the length byte.
             
+            receivedBytes -- a bytearray of the bytes just appended to self.inProcessPacket
+            commDebug -- True if debug output on the 'comm' channel is enabled
+            """
+            if len(self.inProcessPacket) < self.headerSize: return  #header is still incomplete
+            length = self.unpackHeader(self.inProcessPacket)[-1]  #length is the last field of the fixed-layout header
+            if commDebug:
+                utilities.debugNotice(None, 'comm', "HEADER: [" + "".join([str(byte) + "," for byte in self.inProcessPacket]) + "]")
+                utilities.debugNotice(None, 'comm', "[Receiver State: waitingToFinish]")
+                utilities.debugNotice(None, 'comm', "PAYLOAD: [", newLine = False)
+            if length < self.headerSize:    #a valid length always counts the header
+                if commDebug:
+                    utilities.debugNotice(None, 'comm', "]")
+                    utilities.debugNotice(None, 'comm', "Length " + str(length) + " Is Shorter Than Header")
+                    utilities.debugNotice(None, 'comm', "--- RECEIVER RESET ---")
+                self.resetReceiverState()
+                return
+            self.packetReceiveState = self.receiveRemainder
+            self.packetLength = length + 1  #checksum byte is not included in the figure reported by the length token.
+            self.bytesExpected = self.packetLength
+        
+        def receiveRemainder(self, receivedBytes, commDebug):
+            """Receiver state handler while waiting on the payload and checksum.
+            
+            receivedBytes -- a bytearray of the bytes just appended to self.inProcessPacket
+            commDebug -- True if debug output on the 'comm' channel is enabled
+            """
+            if len(self.inProcessPacket) == self.packetLength:  #entire packet has been received
+                if commDebug:
+                    utilities.debugNotice(None, 'comm', "".join([str(byte) + "," for byte in receivedBytes[:-1]]) + "]")
+                    utilities.debugNotice(None, 'comm', "CHECKSUM: " + str(receivedBytes[-1]))
+                decodedPacket = self.validateAndDecodeInProcessPacket()
+                if decodedPacket: #packet validates against checksum
+                    if commDebug: utilities.debugNotice(None, 'comm', "PACKET RECEIVED SUCCESSFULLY")
+                    self.putDecodedPacket(decodedPacket)    #put the decoded packet in the router queue
+                else:   #packet didn't validate, reset the receiver and continue
+                    if commDebug:
+                        utilities.debugNotice(None, 'comm', "CHECKSUM DID NOT VALIDATE")
+                        utilities.debugNotice(None, 'comm', "--- RECEIVER RESET ---")
+                self.resetReceiverState()
+            else:   #haven't reached the end of the packet yet
+                if commDebug: utilities.debugNotice(None, 'comm', "".join([str(byte) + "," for byte in receivedBytes]), newLine = False)
+        
         def run(self):
-            """Main receiver loop."""
+            """Main receiver loop.
             
+            Each chunk of received bytes is appended to the receive buffer and then handed to the current state handler, which is stored
+            directly in self.packetReceiveState so that no state comparison is needed per byte. Each read requests exactly the number of
+            bytes the current state is waiting on: the start byte, then the rest of the fixed-size header, then the payload and checksum.
+            """
+            self.unpackHeader = self.interface._gestaltPacketHeader_.unpack_from  #parses the fixed-layout header at the start of the buffer
+            self.headerSize = self.interface._gestaltPacketHeader_.size   #header length in bytes, up through the length byte
+            self.putDecodedPacket = self.interface._packetRouter_.putDecodedPacket  #alias to the router's input, looked up once
             self.resetReceiverState()   #reset the receiver state
-            decodeIncompletePacket = self.interface._gestaltPacket_.decodeTokenInIncompletePacket #just a convenient alias to the gestalt packet's decodeIncompletePacket method
             
             while True:
-                if self.interface._interface_:  #a downstream interface exists
-                    receivedCharacter = self.interface._interface_.receive()    #will attempt to read in one character, but will return '' if nothing is avaliable after timeout period, or port is disconnected
+                downstreamInterface = self.interface._interface_
+                if downstreamInterface:  #a downstream interface exists
+                    #read up to the number of bytes the current state needs. Returns '' if nothing is avaliable after timeout period, or port is disconnected
+                    receivedCharacters = downstreamInterface.receive(self.bytesExpected - len(self.inProcessPacket))
                 else:
                     time.sleep(self.interface._threadIdleTime_) #idle
-                    continue                    
-                if receivedCharacter:    #character was received
-                    receivedByte = ord(receivedCharacter)   #convert to an integer byte
-                    self.inProcessPacket += [receivedByte]
-                    if self.packetReceiveState == 'waitingOnStartByte': #waiting on the start byte
-                        success, startByte = decodeIncompletePacket('_startByte_', self.inProcessPacket)
-                        utilities.debugNotice(None, 'comm', "--- RECEIVER TRIGGERED ---", padding = True)
-                        if success: #could successfully decode start byte
-                            if (startByte == 72 or startByte == 138):   #start byte is valid
-                                utilities.debugNotice(None, 'comm', "Incoming " + {72:'UNICAST', 138:'MULTICAST'}[startByte] + " Packet")
-                                utilities.debugNotice(None, 'comm', "[Receiver State: waitingOnLengthByte]")
-                                utilities.debugNotice(None, 'comm', "HEADER: ["+ str(startByte) + ",", newLine = False)
-                                self.packetReceiveState = 'waitingOnLengthByte'   #put receiver in next state: wait for address to be received
-                                continue
-                            else:
-                                utilities.debugNotice(None, 'comm', "Start Byte " + str(startByte) + " Not Recognized")
-                                utilities.debugNotice(None, 'comm', "--- RECEIVER RESET ---")
-                                self.resetReceiverState() #reset the receiver state, and begin listening again
-                                continue
-                        else:   #haven't received the _startByte_ yet. In case for some reason _startByte_ ever becomes a two-byte word. Leaving this interpretation up to the packet.
-                            utilities.debugNotice(None, 'comm', "Start Byte Not Received Correctly")
-                            utilities.debugNotice(None, 'comm', "CONTINUING TO LISTEN...")
-                            continue
-                        
-                    elif self.packetReceiveState == 'waitingOnLengthByte': #waiting on the length
-                        utilities.debugNotice(None, 'comm', str(receivedByte)+",", newLine = False)
-                        success, length = decodeIncompletePacket('_length_', self.inProcessPacket)
-                        if success:
-                            utilities.debugNotice(None, 'comm', "]")
-                            utilities.debugNotice(None, 'comm', "[Receiver State: waitingToFinish]")
-                            utilities.debugNotice(None, 'comm', "PAYLOAD: [", newLine = False)
-                            self.packetReceiveState = 'waitingToFinish'
-                            self.packetLength = length + 1  #checksum byte is not included in the figure reported by the length token.
-                        continue
-                    
-                    elif self.packetReceiveState == 'waitingToFinish':
-                        if len(self.inProcessPacket) == self.packetLength:  #entire packet has been received
-                            utilities.debugNotice(None, 'comm', "]")
-                            utilities.debugNotice(None, 'comm', "CHECKSUM: " + str(receivedByte))
-                            decodedPacket = self.validateAndDecodeInProcessPacket()
-                            if decodedPacket: #packet validates against checksum
-                                utilities.debugNotice(None, 'comm', "PACKET RECEIVED SUCCESSFULLY")
-                                self.interface._packetRouter_.putDecodedPacket(decodedPacket)    #convert to packets.serializedPacket type and put the decoded packet in the router queue
-                                self.resetReceiverState()   #reset the receiver state
-                                continue
-                            else:   #packet didn't validate, reset the receiver and continue
-                                utilities.debugNotice(None, 'comm', "CHECKSUM DID NOT VALIDATE")
-                                utilities.debugNotice(None, 'comm', "--- RECEIVER RESET ---")
-                                self.resetReceiverState()
-                                continue
-                        else:   #haven't reached the end of the packet yet
-                            utilities.debugNotice(None, 'comm', str(receivedByte) + ",", newLine = False)
-                            continue
+                    continue
+                if receivedCharacters:    #at least one character was received
+                    receivedBytes = bytearray(receivedCharacters)   #iterating a bytearray yields integer bytes
+                    self.inProcessPacket += receivedBytes
+                    self.packetReceiveState(receivedBytes, utilities.debugEnabled('comm'))  #dispatch to the current state handler
                 else:   #receiver timed out, reset state
                     self.resetReceiverState()
                     time.sleep(self.interface._threadIdleTime_) #idle
@@ -956,10 +1066,7 @@ class gestaltInterface(baseInterface):
         
         address -- the virtual node address to be looked up.
         """
-        if address in self._addressNodeTable_:  #check that a virtual node matches the provided address
-            return self._addressNodeTable_[address] #returns the matching node
-        else:
-            return False    #address does not map to a node, return False
+        return self._addressNodeTable_.get(address, False)  #returns the matching node, or False if address does not map to a node
         
 
     class _packetRouterThread_(_interfaceThread_):
@@ -972,38 +1079,41 @@ class gestaltInterface(baseInterface):
         """
         def init(self):
             """Packet router thread initialization method."""
-            self.routerQueue = queue.Queue()    #create a packet router queue.
+            self.routerQueue = queue.Queue(maxsize = self.interface._maxQueueDepth_)    #create a packet router queue. Bounded, so that a stalled router can't grow memory without limit.
         
         def run(self):
             """Packet router loop.
             
             Note that inbound packets are pulled from the queue already decoded (this was done in the receive thread to validate the checksum).
             """
+            getVirtualNodeFromAddress = self.interface._getVirtualNodeFromAddress_  #alias, looked up once
             while True:
-                pending, decodedPacket = self.getDecodedPacket()  #get the next decoded packet from the queue
-                if pending: #a packet was waiting
+                for decodedPacket in self.getDecodedPackets():  #get all pending decoded packets from the queue, in order
                     destinationAddress = decodedPacket['_address_']
                     destinationPort = decodedPacket['_port_']
                     payload = decodedPacket['_payload_']
-                    virtualNode = self.interface._getVirtualNodeFromAddress_(destinationAddress)    #look up virtual node that matches the packet's address
+                    virtualNode = getVirtualNodeFromAddress(destinationAddress)    #look up virtual node that matches the packet's address
                     virtualNode._routeInboundPacket_(port = destinationPort, packet = payload) #call the virtual node's packet router method
-                else:
-                    time.sleep(self.interface._threadIdleTime_) #idle
 
         def putDecodedPacket(self, decodedPacket):
             """Places decoded packet dictionaries into the router queue.
             
             decodedPacket -- the decoded packet dictionary to place into the queue.
+            
+            If the queue stays full for longer than _queueWaitTime_, the packet is dropped.
+            
+            Returns True if the packet was queued, or False if it was dropped.
             """
-            self.routerQueue.put(decodedPacket)
-            return True
+            try:
+                self.routerQueue.put(decodedPacket, timeout = self.interface._queueWaitTime_)
+                return True
+            except queue.Full:
+                notice(self.interface, "Packet router queue is full. Dropping inbound packet for address " + str(decodedPacket['_address_']) + ".")
+                return False
                     
-        def getDecodedPacket(self):
-            """Attempts to pull a decoded packet dictionary from the router queue.
+        def getDecodedPackets(self):
+            """Pulls a batch of decoded packet dictionaries from the router queue, blocking for up to _queueWaitTime_ if the queue is empty.
             
-            Returns (True, decodedPacket) if a decoded packet dictionary was waiting in the queue, or (False, None) if not.
+            Returns a list of decoded packet dictionaries in the order they were received, or an empty list if none were waiting.
             """
-            try:
-                return True, self.routerQueue.get(block = False)    #signal success, return decoded packet
-            except queue.Empty:
-                return False, None  #signal failure, return None  
\ No newline at end of file
+            return self.drainQueue(self.routerQueue)  
\ No newline at end of file
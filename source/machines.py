@@ -27,20 +27,9 @@ class virtualMachine(object):
                        persistence manager.
         """
         
-        if "name" in kwargs:
-            self._name_ = kwargs.pop("name")    #pop name from named arguments, and set as node name. This is used by utilities.notice and for persistence.
-        else:
-            self._name_ = None  #default value
-            
-        if "interface" in kwargs:
-            self.interface = kwargs.pop("interface")      #the gestalt interface which the virtual machine will set as the interface property.
-        else:
-            self.interface = None
-            
-        if "persistence" in kwargs:
-            self._persistence_ = kwargs.pop("persistence")
-        else:
-            self._persistence_ = None            
+        self._name_ = kwargs.pop("name", None)    #pop name from named arguments, and set as node name. This is used by utilities.notice and for persistence.
+        self.interface = kwargs.pop("interface", None)      #the gestalt interface which the virtual machine will set as the interface property.
+        self._persistence_ = kwargs.pop("persistence", None)
         
         self.init(*args, **kwargs)
         
@@ -49,10 +38,10 @@ class virtualMachine(object):
         
         if self._persistence_:
             candidatePersistenceManager = utilities.generatePersistenceManager(self._persistence_, namespace = self._name_)
-            try:
+            if hasattr(self.interface, "setPersistenceManager"):
                 self.interface.setPersistenceManager(candidatePersistenceManager)
-            except:
-                notice(self, "Unable to set the persistence manager!")
+            else: #no interface, or the interface doesn't support persistence
+                utilities.notice(self, "Unable to set the persistence manager!")
         
         self.initNodes()
         self.initMechanics()
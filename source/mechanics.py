@@ -4,6 +4,8 @@
 
 #---- INCLUDES ----
 import math
+import functools
+import operator
 from pygestalt import errors, units, utilities, geometry
 
 class transformer(object):
@@ -24,6 +26,8 @@ class transformer(object):
                     robots, but also polar bots, robotic arms, five bar linkages,etc.
     """
     
+    __slots__ = ('forwardTransform', 'reverseTransform', 'inertia', 'dimensions') #subclasses that don't declare __slots__ still get a __dict__
+    
     def __init__(self, forwardTransform, reverseTransform = None, inertia = 0.0):
         """Initializer for the transformer.
         
@@ -41,8 +45,15 @@ class transformer(object):
             self.reverseTransform = reverseTransform
         else: #no reverse transform provided. Try to invert the forward transform.
             try:
-                self.reverseTransform = forwardTransform**-1
-            except:
+                if isinstance(forwardTransform, units.dFloat): #scalar with units, use the cached unit reciprocal
+                    self.reverseTransform = forwardTransform.reciprocal()
+                elif isinstance(forwardTransform, (int, float)): #plain scalar
+                    self.reverseTransform = 1.0/forwardTransform
+                elif isinstance(forwardTransform, geometry.matrix): #matrix, invert directly
+                    self.reverseTransform = forwardTransform.inverse()
+                else:
+                    self.reverseTransform = forwardTransform**-1
+            except (TypeError, ArithmeticError, AttributeError, errors.Error): #only failures to invert, not e.g. KeyboardInterrupt
                 raise errors.MechanismError("No reverse transform provided. Forward transform [" + str(forwardTransform) + "] is not invertable!")
         self.inertia = inertia
         
@@ -72,6 +83,85 @@ class transformer(object):
         inputState = self.reverseTransform * outputState
         return inputState
 
+    def _applyGain_(self, gain, state, unitCacheName):
+        """Multiplies a state by a gain of the transformer, re-using previously composed units where possible.
+        
+        gain -- the forward or reverse transform of the transformer, or the combined gain of a chain
+        state -- the state to be transformed
+        unitCacheName -- the name of the attribute holding the (input units, output units) pair cached for this direction
+        
+        Composing units is much more expensive than multiplying floats, and successive calls almost always pass in states with the
+        same units. So the resulting units are only composed when the units of the state change from the previous call.
+        """
+        if not isinstance(gain, float): #custom transform, let it handle the multiplication
+            return gain * state
+        if not isinstance(state, units.dFloat):
+            if isinstance(gain, units.dFloat) and isinstance(state, (int, float)): #plain number takes on the units of the transform
+                return units.dFloat(float(gain) * state, gain.units)
+            return gain * state
+        lastStateUnits, lastResultUnits = getattr(self, unitCacheName) #cache is stored as a tuple so that it's always self-consistent
+        if state.units is not lastStateUnits: #units changed, compose new result units
+            result = gain * state
+            setattr(self, unitCacheName, (state.units, result.units))
+            return result
+        return units.dFloat(float(gain) * float(state), lastResultUnits)
+
+    def isIdentity(self):
+        """Returns True if the transformer passes states thru unchanged in both directions.
+        
+        Containers use this to skip calling such transformers altogether.
+        """
+        return False
+
+    def getRevision(self):
+        """Returns a counter that increases whenever the transformation performed by the transformer changes.
+        
+        Most transformers are fixed once constructed, and so always return 0. Transformers with adjustable state, such as offset,
+        override this. It is used to invalidate memoized results.
+        """
+        return 0
+
+    def roundTrip(self, outputState):
+        """Transforms an output state in reverse and then forward again, returning the resulting output state.
+        
+        outputState -- the reverse-going output state of the transformer.
+        
+        This is useful for calibration and diagnostics, to verify that a transformer is self-consistent. Ideally the returned state
+        matches outputState.
+        """
+        return self.forward(self.reverse(outputState))
+
+    def forwardBatch(self, forwardStates):
+        """Transforms a sequence of input states of the transformer into their corresponding output states.
+        
+        forwardStates -- a list of forward-going input states of the transformer.
+        
+        Scalar transformers multiply every state by their gain in one pass, composing units only when they change. Other transformers
+        pass each state thru forward() in turn.
+        
+        Returns a list of output states.
+        """
+        scalarGains = self.getScalarGains()
+        if scalarGains == None: #not a scalar multiplier
+            return [self.forward(forwardState) for forwardState in forwardStates]
+        else:
+            return applyScalarGain(scalarGains[0], forwardStates)
+    
+    def reverseBatch(self, outputStates):
+        """Transforms a sequence of output states of the transformer into their corresponding input states.
+        
+        outputStates -- a list of reverse-going output states of the transformer.
+        
+        See forwardBatch() for details.
+        
+        Returns a list of input states.
+        """
+        scalarGains = self.getScalarGains()
+        if scalarGains == None: #not a scalar multiplier
+            return [self.reverse(outputState) for outputState in outputStates]
+        else:
+            return applyScalarGain(scalarGains[1], outputStates)
+
     def calculateDimensions(self):
         """Determines and returns the input and output dimensions of the transformer.
         
@@ -95,6 +185,19 @@ class transformer(object):
         
         return (outputDimension, inputDimension)
     
+    def getScalarGains(self):
+        """Returns the forward and reverse gains of the transformer if it is a simple scalar multiplier.
+        
+        Returns (forwardGain, reverseGain) if both transforms are (dimensional) floating point numbers, or None otherwise. A transformer
+        with scalar gains can be collapsed together with its neighbors into a single multiplication.
+        """
+        forwardTransform = getattr(self, 'forwardTransform', None)
+        reverseTransform = getattr(self, 'reverseTransform', None)
+        if isinstance(forwardTransform, float) and isinstance(reverseTransform, float):
+            return (forwardTransform, reverseTransform)
+        else:
+            return None
+    
     def getSize(self):
         """Returns the pre-calculated input and output dimensions of the transformer.
         
@@ -111,6 +214,10 @@ class transformer(object):
 class singleAxisElement(transformer):
     """A one-dimensional machine element that transforms state from one domain to another."""
     
+    __slots__ = ('inputUnits', 'outputUnits', '_forwardUnitCache_', '_reverseUnitCache_', '_forwardGainValue_', '_reverseGainValue_')
+    
+    _transformUnitsCache_ = {} #{(outputUnits, inputUnits): outputUnits/inputUnits}, shared by all elements
+    
     def __init__(self, transform, inputUnits, outputUnits, inertia = None):
         """Initializes a new single-axis element.
         
@@ -122,18 +229,43 @@ class singleAxisElement(transformer):
         """
         
         
-        if type(inputUnits) == units.unit and type(outputUnits) == units.unit: #check for valid units
+        if isinstance(inputUnits, units.unit) and isinstance(outputUnits, units.unit): #check for valid units
             self.inputUnits = inputUnits
             self.outputUnits = outputUnits
         else:
             raise errors.UnitError("Input and output units must be of type units.unit")
 
         if inputUnits != outputUnits:
-            transform = (outputUnits/inputUnits)(transform) #convert transform to provided units
+            transform = self.getTransformUnits(inputUnits, outputUnits)(transform) #convert transform to provided units
 
         #for now we assume any input that isn't a dFloat is a scalar of some type. Later, this needs to be appended to include custom transforms.
         super(singleAxisElement, self).__init__(forwardTransform = transform, reverseTransform = None, inertia = inertia)
 
+        self._forwardUnitCache_ = (None, None) #(last input units, corresponding output units) in the forward direction
+        self._reverseUnitCache_ = (None, None) #(last output units, corresponding input units) in the reverse direction
+
+        scalarGains = self.getScalarGains()
+        if scalarGains != None: #store unitless gains for forwardFloat and reverseFloat
+            self._forwardGainValue_, self._reverseGainValue_ = float(scalarGains[0]), float(scalarGains[1])
+        else:
+            self._forwardGainValue_, self._reverseGainValue_ = None, None
+
+    @classmethod
+    def getTransformUnits(cls, inputUnits, outputUnits):
+        """Returns the compound units of a transform from inputUnits to outputUnits.
+        
+        inputUnits -- units of the input to the transformer in the forward direction.
+        outputUnits -- units of the output from the transformer in the forward direction.
+        
+        Machines typically contain many elements of the same few types, so rather than deriving a new compound unit for each element,
+        the derived units are cached and shared. This also lets elements of the same type share unit objects.
+        """
+        unitsKey = (outputUnits, inputUnits)
+        transformUnits = cls._transformUnitsCache_.get(unitsKey)
+        if transformUnits == None: #not yet derived
+            transformUnits = outputUnits/inputUnits
+            cls._transformUnitsCache_[unitsKey] = transformUnits
+        return transformUnits
 
     def forward(self, forwardState):
         """Tranforms from an input state of the tranformer to the corresponding output state.
@@ -143,7 +275,7 @@ class singleAxisElement(transformer):
         Note that this function over-rides its base class transformer.forward() function.
         """
         
-        return self.forwardTransform * forwardState
+        return self._applyGain_(self.forwardTransform, forwardState, '_forwardUnitCache_')
         # if type(forwardState) == units.dFloat:
         #     convertedForwardState = self.inputUnits(forwardState)
         #     return self.forwardTransform*convertedForwardState
@@ -159,7 +291,7 @@ class singleAxisElement(transformer):
         Note that this function over-rides its base class transformer.forward() function.
         """
         
-        return self.reverseTransform*reverseState
+        return self._applyGain_(self.reverseTransform, reverseState, '_reverseUnitCache_')
         # if type(reverseState) == units.dFloat:
         #     convertedReverseState = self.outputUnits(reverseState)
         #     return self.reverseTransform*convertedReverseState
@@ -167,6 +299,29 @@ class singleAxisElement(transformer):
         #     utilities.notice(self, "Input to singleAxisElement transformer must be of type units.dFloat!")
         #     raise errors.MechanismError("Incorrect input type to singleAxisElement.reverse()")
 
+    def forwardFloat(self, forwardValue):
+        """Transforms a unitless input value into the corresponding unitless output value.
+        
+        forwardValue -- the forward-going input of the transformer as a float, in the input units of the element.
+        
+        This skips all unit handling, and is intended for inner loops that already know what units they're working in.
+        Returns the output value as a float, in the output units of the element.
+        """
+        if self._forwardGainValue_ == None: #not a scalar transform
+            return float(self.forward(forwardValue))
+        return self._forwardGainValue_ * forwardValue
+    
+    def reverseFloat(self, reverseValue):
+        """Transforms a unitless output value into the corresponding unitless input value.
+        
+        reverseValue -- the reverse-going output of the transformer as a float, in the output units of the element.
+        
+        Returns the input value as a float, in the input units of the element.
+        """
+        if self._reverseGainValue_ == None: #not a scalar transform
+            return float(self.reverse(reverseValue))
+        return self._reverseGainValue_ * reverseValue
+
     # def transform(self, inputState):
     #     """Transforms from one state to another based on the provided input units.
           
@@ -194,9 +349,18 @@ class singleAxisElement(transformer):
 
 #---- SINGLE AXIS ELEMENT TYPES ----
 
+def circumference(diameter):
+    """Returns the circumference of a circle with the provided diameter.
+    
+    diameter -- a float or units.dFloat. If a dFloat is provided, the circumference will carry the same units.
+    """
+    return math.pi*diameter
+
 class leadscrew(singleAxisElement):
     """A mechanical element that transforms rotation into translation by means of a helical screw."""
     
+    __slots__ = ()
+    
     def __init__(self, lead):
         """Initializes a new leadscrew.
         
@@ -210,6 +374,8 @@ class leadscrew(singleAxisElement):
 class gear(singleAxisElement):
     """A mechanical element that transforms torque and angular velocity by means of meshing teeth."""
     
+    __slots__ = ()
+    
     def __init__(self, reductionRatio):
         """Initializes a new gear set.
         
@@ -225,6 +391,8 @@ class gear(singleAxisElement):
 
 class rotaryPulley(singleAxisElement):
     """A mechanical element that transforms torque and angular velocity by means of a belt connecting two pulleys."""
+    
+    __slots__ = ()
 
     def __init__(self, reductionRatio):
         """Initializes a new rotary pulley set.
@@ -239,6 +407,8 @@ class rotaryPulley(singleAxisElement):
 
 class timingBelt(singleAxisElement):
     """A mechanical element that transforms rotation into translation by means of a toothed pulley meshed with a timing belt."""
+    
+    __slots__ = ()
 
     def __init__(self, pulleyPitchDiameter):
         """Initializes a new timing belt.
@@ -246,24 +416,28 @@ class timingBelt(singleAxisElement):
         pulleyPitchDiameter -- the pitch diameter of the timing pulley, in mm.
         """
         
-        pitchCircumference = math.pi*pulleyPitchDiameter #transformation ratio is the circumference when going from rev -> travel distance
+        pitchCircumference = circumference(pulleyPitchDiameter) #transformation ratio is the circumference when going from rev -> travel distance
         super(timingBelt, self).__init__(transform = pitchCircumference, inputUnits = units.rev, outputUnits = units.mm)
 
 class rack(singleAxisElement):
     """A mechanical element that transforms rotation into translation by means of a gear pinion meshed with a flat gear rack."""
     
+    __slots__ = ()
+    
     def __init__(self, pinionPitchDiameter):
         """Initializes a new rack and pinion.
         
         pinionPitchDiameter -- the pitch diameter of the pinion, in mm.
         """
         
-        pitchCircumference = math.pi*pinionPitchDiameter #transformation is circumference when going from rev -> travel distance
+        pitchCircumference = circumference(pinionPitchDiameter) #transformation is circumference when going from rev -> travel distance
         super(rack, self).__init__(transform = pitchCircumference, inputUnits = units.rev, outputUnits = units.mm)
 
 class stepper(singleAxisElement):
     """An electromechanical element that transforms electrical 'step' pulses into rotation."""
     
+    __slots__ = ()
+    
     def __init__(self, stepSize):
         """Initializes a new stepper motor.
         
@@ -275,6 +449,8 @@ class stepper(singleAxisElement):
 class invert(transformer):
     """A single-axis utility element that inverts the sign of the signal passing thru it."""
     
+    __slots__ = ()
+    
     def __init__(self):
         """Initializes a new inverter."""
         super(invert, self).__init__(forwardTransform = -1.0)
@@ -288,46 +464,90 @@ class matrixTransformer(transformer):
     performs the necessary pre-formatting of inputs and post-formatting of results.
     """
     
+    __slots__ = ('_forwardRows_', '_reverseRows_')
+    
+    def __init__(self, forwardTransform, reverseTransform = None, inertia = 0.0):
+        """Initializes a new matrix transformer.
+        
+        See transformer.__init__ for a description of the arguments.
+        
+        The rows of the forward and reverse transform matrices are stored as plain tuples, so that transforming a state doesn't
+        need to construct, transpose, and unpack intermediate matrix objects.
+        """
+        super(matrixTransformer, self).__init__(forwardTransform = forwardTransform, reverseTransform = reverseTransform, inertia = inertia)
+        self._forwardRows_ = tuple(tuple(row) for row in self.forwardTransform)
+        self._reverseRows_ = tuple(tuple(row) for row in self.reverseTransform)
+    
     def forward(self, forwardState):
         """Transform in the forward direction.
         
         forwardState -- a list-formatted single-row array containing the input state of the transformer.
         
-        The purpose of this method is just to convert the input state into a 2D column matrix so it can be multiplied
-        by the forward transform matrix.
+        Returns the product of the forward transform matrix and the input state, as a list-formatted single-row array.
         """
-        forwardStateMatrix = geometry.matrix(forwardState).transpose()
-        outputStateMatrix = self.forwardTransform*forwardStateMatrix
-        outputState = list(outputStateMatrix.transpose())[0]
-        return outputState
+        return applyMatrixRows(self._forwardRows_, forwardState)
     
     def reverse(self, reverseState):
         """Transform in the reverse direction.
         
         reverseState -- a list-formatted single-row array containing the output state of the transformer.
         
-        The purpose of this method is just to convert the output state into a 2D column matrix so it can be multiplied
-        by the reverse transform matrix. 
+        Returns the product of the reverse transform matrix and the output state, as a list-formatted single-row array.
         """
-        reverseStateMatrix = geometry.matrix(reverseState).transpose()
-        inputStateMatrix = self.reverseTransform*reverseStateMatrix
-        inputState = list(inputStateMatrix.transpose())[0]
-        return inputState   
+        return applyMatrixRows(self._reverseRows_, reverseState)
     
 class corexy(matrixTransformer):
     """CoreXY or H-bot based kinematics.
     
     See www.corexy.com
     """
+    
+    __slots__ = ()
+    
     def __init__(self):
         """Initializes a new corexy transformer."""
         forwardTransform = geometry.matrix([[0.5, 0.5], [0.5, -0.5]])
         super(corexy, self).__init__(forwardTransform = forwardTransform)
 
+    def forward(self, forwardState):
+        """Transform in the forward direction.
+        
+        forwardState -- a list-formatted array containing the two motor states of the corexy stage.
+        
+        The corexy transform matrix is fixed, so its product is written out directly rather than computed by applyMatrixRows.
+        Like the general matrix product, this returns plain floats.
+        
+        Note that this function over-rides its base class matrixTransformer.forward() function.
+        """
+        motorA, motorB = self.validateState(forwardState)
+        return [0.5*(motorA + motorB), 0.5*(motorA - motorB)]
+    
+    def reverse(self, reverseState):
+        """Transform in the reverse direction.
+        
+        reverseState -- a list-formatted array containing the x and y states of the corexy stage.
+        
+        Note that this function over-rides its base class matrixTransformer.reverse() function.
+        """
+        xState, yState = self.validateState(reverseState)
+        return [xState + yState, xState - yState]
+    
+    def validateState(self, state):
+        """Checks that a state has two axes, and returns them as floats.
+        
+        state -- a list-formatted array containing two values
+        """
+        if not isinstance(state, list) or len(state) != 2:
+            raise errors.MatrixError("Corexy transformer state must be provided as a list-formatted array with two values.")
+        return float(state[0]), float(state[1])
+
 
 #---- UTILITY TRANSFORMERS ----
 class router(transformer):
     """A transformer that routes from a set of inputs to a set of outputs"""
+    
+    __slots__ = ('forwardRoutingMap', 'reverseRoutingMap', '_forwardGetter_', '_reverseGetter_')
+    
     def __init__(self, forwardRoutingMap):
         """Initializes the routing transformer.
         
@@ -346,12 +566,14 @@ class router(transformer):
             self.reverseRoutingMap[value] = index
             
         self.dimensions = self.calculateDimensions()
+        self._forwardGetter_ = routingGetter(self.forwardRoutingMap) #gathers all routed items in one call
+        self._reverseGetter_ = routingGetter(self.reverseRoutingMap)
 
     def forward(self, forwardState):
-        return [forwardState[index] for index in self.forwardRoutingMap]
+        return list(self._forwardGetter_(forwardState))
     
     def reverse(self, reverseState):
-        return [reverseState[index] for index in self.reverseRoutingMap]
+        return list(self._reverseGetter_(reverseState))
 
     def calculateDimensions(self):
         """Calculates and returns the dimensions of the router."""
@@ -359,11 +581,28 @@ class router(transformer):
         return (routingMapSize, routingMapSize)        
 
 
+def routingGetter(routingMap):
+    """Returns a function that gathers the items of a state in the order given by a routing map.
+    
+    routingMap -- a list of indices into the state
+    
+    The returned function always returns a tuple. operator.itemgetter is used to perform the gather, but returns a bare item
+    rather than a tuple when given a single index, so that case is wrapped.
+    """
+    if len(routingMap) == 1:
+        routingIndex = routingMap[0]
+        return lambda state: (state[routingIndex],)
+    return operator.itemgetter(*routingMap)
+
+
 class offset(transformer):
     """A transformer that applies a constant offset.
     
     This is useful for implementing homing and zeroing.
     """
+    
+    __slots__ = ('dof', '_offset_', 'revision')
+    
     def __init__(self, dof):
         """Initializes the offset.
         
@@ -371,7 +610,22 @@ class offset(transformer):
         """
         self.dof = dof
         self.dimensions = self.calculateDimensions()
-        self.offset = geometry.array([0.0 for degreeOfFreedom in range(self.dof)])
+        self.revision = 0 #incremented whenever the offset changes
+        self._offset_ = geometry.array([0.0 for degreeOfFreedom in range(self.dof)])
+    
+    @property
+    def offset(self):
+        """The offset currently applied by the transformer."""
+        return self._offset_
+    
+    @offset.setter
+    def offset(self, offsetArray):
+        """Stores a new offset, and bumps the revision so that any memoized chain results are invalidated.
+        
+        offsetArray -- a geometry.array containing the offsets to apply.
+        """
+        self._offset_ = offsetArray
+        self.revision += 1
     
     def calculateDimensions(self):
         """Calculates and returns the dimensions of the offset.
@@ -406,6 +660,13 @@ class offset(transformer):
         else:
             raise errors.MechanismError("Unable to adjust offset.")
 
+    def getRevision(self):
+        """Returns the number of times the offset has been changed.
+        
+        Note that this method overrides transformer.getRevision.
+        """
+        return self.revision
+
     def forward(self, forwardState):
         """Transform in the forward direction.
         
@@ -413,7 +674,9 @@ class offset(transformer):
         
         Offset is applied by adding it to forwardState
         """
-        return list(forwardState + self.offset)
+        if isinstance(forwardState, list): #add item-by-item directly, rather than building an intermediate geometry.array
+            return [stateValue + offsetValue for stateValue, offsetValue in zip(forwardState, self._offset_)]
+        return list(forwardState + self._offset_)
     
     def reverse(self, reverseState):
         """Transform in the reverse direction.
@@ -422,7 +685,9 @@ class offset(transformer):
         
         Offset is applied by subtracting it from reverseState
         """
-        return list(reverseState - self.offset)
+        if isinstance(reverseState, list): #subtract item-by-item directly, rather than building an intermediate geometry.array
+            return [stateValue - offsetValue for stateValue, offsetValue in zip(reverseState, self._offset_)]
+        return list(reverseState - self._offset_)
 
     def validateOffset(self, offsetArray):
         """Validates that a provided offset array is compatible with the transformer.
@@ -431,12 +696,11 @@ class offset(transformer):
         
         Returns True if validation passes, or False if not.
         """                       
-        offsetSize = geometry.arraySize(offsetArray)
-        if len(offsetSize) > 1:
-            utilities.notice(self, "Provided offset array has a dimension of "+ str(len(offsetSize)) + ", and must be 1D!")
+        if not isinstance(offsetArray, list) or isinstance(next(iter(offsetArray), None), list): #only a flat list is 1D
+            utilities.notice(self, "Provided offset array has a dimension of "+ str(geometry.arrayDimension(offsetArray)) + ", and must be 1D!")
             return False
-        elif offsetSize[0]!= self.dof:
-            utilities.notice(self, "Provided offset has a size of " + str(offsetSize[0]) + " DOF, but the transformer has " + str(self.dof)+ " DOF.")
+        elif len(offsetArray) != self.dof:
+            utilities.notice(self, "Provided offset has a size of " + str(len(offsetArray)) + " DOF, but the transformer has " + str(self.dof)+ " DOF.")
             return False
         else:
             return True        
@@ -447,6 +711,9 @@ class passThru(transformer):
     
     This type of transformer can act as a place-holder in a stack, so that the stack has the correct dimensionality.
     """
+    
+    __slots__ = ('lanes',)
+    
     def __init__(self, lanes):
         """Initializes the pass-thru.
         
@@ -469,6 +736,13 @@ class passThru(transformer):
         """
         return reverseState
     
+    def isIdentity(self):
+        """Returns True, as the pass-thru never changes the state.
+        
+        Note that this method overrides transformer.isIdentity.
+        """
+        return True
+    
     def calculateDimensions(self):
         """Calculates and returns the dimensions of the pass-thru.
         
@@ -481,13 +755,72 @@ class passThru(transformer):
 class chain(transformer):
     """A serial chain of transformer elements."""
     
+    __slots__ = ('transformChain', 'scalarGains', '_forwardSteps_', '_reverseSteps_', '_forwardFloatSteps_', '_reverseFloatSteps_',
+                 '_forwardGainValue_', '_reverseGainValue_', '_memoTolerance_', '_forwardMemo_', '_reverseMemo_',
+                 '_forwardUnitCache_', '_reverseUnitCache_')
+    
     def __init__(self, *transformers):
         """Initializes a new transformer chain.
         
         *transformers -- a series of transformer elements, provided as positional arguments in the forward direction.
+        
+        Any chains provided as elements are flattened into this chain, so that transforming a state doesn't need to descend thru
+        nested chains.
         """
+        transformers = tuple(subElement for transformerElement in transformers
+                             for subElement in (transformerElement.transformChain if isinstance(transformerElement, chain) else (transformerElement,)))
         self.transformChain = transformers
         self.dimensions = self.calculateDimensions()
+        self.scalarGains = self.calculateScalarGains() #(forwardGain, reverseGain) if the chain collapses to a single multiplier, otherwise None
+        if self.scalarGains != None: #store unitless gains for forwardFloat and reverseFloat
+            self._forwardGainValue_, self._reverseGainValue_ = float(self.scalarGains[0]), float(self.scalarGains[1])
+        self._forwardUnitCache_ = (None, None) #(last input units, corresponding output units) for the combined forward gain
+        self._reverseUnitCache_ = (None, None)
+        activeElements = tuple(transformerElement for transformerElement in transformers if not transformerElement.isIdentity()) #pass-thrus needn't be called
+        self._forwardSteps_ = tuple(transformerElement.forward for transformerElement in activeElements) #bound methods, in forward order
+        self._reverseSteps_ = tuple(transformerElement.reverse for transformerElement in reversed(activeElements)) #bound methods, in reverse order
+        if all(hasattr(transformerElement, 'forwardFloat') for transformerElement in activeElements): #every element can transform raw floats
+            self._forwardFloatSteps_ = tuple(transformerElement.forwardFloat for transformerElement in activeElements)
+            self._reverseFloatSteps_ = tuple(transformerElement.reverseFloat for transformerElement in reversed(activeElements))
+        else:
+            self._forwardFloatSteps_, self._reverseFloatSteps_ = None, None
+        self.disableMemo()
+
+    def enableMemo(self, tolerance = 0.0):
+        """Enables re-use of the last result when the chain is called again with the same state.
+        
+        A memoized result is discarded whenever any element of the chain changes, e.g. when an offset is set or adjusted.
+        
+        tolerance -- single-axis input states within this distance of the previous input state are treated as identical. Multi-axis
+                     states must match exactly.
+        
+        This is useful when the chain is evaluated in a control loop that often repeats the same setpoint. It only applies to chains
+        that don't collapse to a single scalar gain, since those already cost a single multiplication. Memoization is off by default.
+        """
+        self._forwardMemo_, self._reverseMemo_ = (None, None, None), (None, None, None) #(last state key, chain revision, last result)
+        self._memoTolerance_ = tolerance
+    
+    def disableMemo(self):
+        """Disables re-use of the last result. See enableMemo()."""
+        self._memoTolerance_ = None
+        self._forwardMemo_, self._reverseMemo_ = (None, None, None), (None, None, None)
+    
+    def _recallMemo_(self, memo, stateKey, revision):
+        """Returns the memoized result if stateKey matches the memoized state, or None otherwise.
+        
+        memo -- a (state key, chain revision, result) tuple
+        stateKey -- the key of the new state, as returned by memoKey()
+        revision -- the current revision of the chain, as returned by getRevision()
+        """
+        lastStateKey, lastRevision, lastResult = memo
+        if lastStateKey == None or revision != lastRevision: #nothing memoized yet, or the chain has changed since
+            return None
+        if stateKey and isinstance(stateKey[0], float): #single-axis state, compare within tolerance
+            if stateKey[1] is not lastStateKey[1] or abs(stateKey[0] - lastStateKey[0]) > self._memoTolerance_: return None
+        elif stateKey != lastStateKey:
+            return None
+        if isinstance(lastResult, list): return list(lastResult) #hand out a copy so the memoized result can't be modified
+        return lastResult
 
     def forward(self, forwardState):
         """Tranforms from an input state of the tranformer chain to the corresponding output state.
@@ -495,11 +828,24 @@ class chain(transformer):
         forwardState -- the forward-going input state of the transformer chain.
         
         Transformation is accomplished by successively feeding the output of each element into the input of the subsequent element.
+        If every element is a scalar multiplier, this is done with a single multiplication by the pre-calculated combined gain. In
+        that case a list of states may also be provided, and a list of output states is returned as with forwardBatch().
         
         Note that this function over-rides its base class transformer.forward() function.
         """
-        for transformerElement in self.transformChain:
-            forwardState = transformerElement.forward(forwardState)
+        if self.scalarGains != None: #chain collapses to a single multiplier
+            if isinstance(forwardState, list): #a list of single-axis states, so transform them all at once
+                return applyScalarGain(self.scalarGains[0], forwardState)
+            return self._applyGain_(self.scalarGains[0], forwardState, '_forwardUnitCache_')
+        if self._memoTolerance_ != None: #memoization is enabled
+            stateKey, revision = memoKey(forwardState), self.getRevision()
+            outputState = self._recallMemo_(self._forwardMemo_, stateKey, revision)
+            if outputState != None: return outputState
+        else:
+            stateKey = None
+        for forwardStep in self._forwardSteps_:
+            forwardState = forwardStep(forwardState)
+        if stateKey != None: self._forwardMemo_ = (stateKey, revision, forwardState) #stored as a tuple so the memo is always self-consistent
         return forwardState
     
     def reverse(self, outputState):
@@ -508,13 +854,164 @@ class chain(transformer):
         outputState -- the reverse-going output state of the transformer chain.
         
         Transformation is accomplished by successively feeding the input of each element into the output of the subsequent element.
+        If every element is a scalar multiplier, this is done with a single multiplication by the pre-calculated combined gain. In
+        that case a list of states may also be provided, and a list of input states is returned as with reverseBatch().
         
         Note that this function over-rides its base class transformer.reverse() function.
         """
-        for transformerElement in reversed(self.transformChain):
-            outputState = transformerElement.reverse(outputState)
+        if self.scalarGains != None: #chain collapses to a single multiplier
+            if isinstance(outputState, list): #a list of single-axis states, so transform them all at once
+                return applyScalarGain(self.scalarGains[1], outputState)
+            return self._applyGain_(self.scalarGains[1], outputState, '_reverseUnitCache_')
+        if self._memoTolerance_ != None: #memoization is enabled
+            stateKey, revision = memoKey(outputState), self.getRevision()
+            inputState = self._recallMemo_(self._reverseMemo_, stateKey, revision)
+            if inputState != None: return inputState
+        else:
+            stateKey = None
+        for reverseStep in self._reverseSteps_:
+            outputState = reverseStep(outputState)
+        if stateKey != None: self._reverseMemo_ = (stateKey, revision, outputState)
         return outputState
     
+    def forwardBatch(self, forwardStates):
+        """Transforms a sequence of input states of the transformer chain into their corresponding output states.
+        
+        forwardStates -- a list of forward-going input states of the transformer chain.
+        
+        If every element in the chain is a scalar multiplier, the chain is collapsed into a single gain and each state costs one
+        multiplication. Otherwise the whole batch is passed thru each element's forwardBatch() in turn, so that any scalar elements
+        in the chain still transform the batch in a single pass.
+        
+        Returns a list of output states.
+        
+        Note that this function over-rides its base class transformer.forwardBatch() function.
+        """
+        if self.scalarGains == None: #at least one element is not a scalar multiplier
+            for transformerElement in self.transformChain:
+                if transformerElement.isIdentity(): continue #pass-thrus needn't be called
+                forwardStates = transformerElement.forwardBatch(forwardStates)
+            return forwardStates
+        else:
+            return applyScalarGain(self.scalarGains[0], forwardStates)
+    
+    def reverseBatch(self, outputStates):
+        """Transforms a sequence of output states of the transformer chain into their corresponding input states.
+        
+        outputStates -- a list of reverse-going output states of the transformer chain.
+        
+        See forwardBatch() for details.
+        
+        Returns a list of input states.
+        
+        Note that this function over-rides its base class transformer.reverseBatch() function.
+        """
+        if self.scalarGains == None: #at least one element is not a scalar multiplier
+            for transformerElement in reversed(self.transformChain):
+                if transformerElement.isIdentity(): continue
+                outputStates = transformerElement.reverseBatch(outputStates)
+            return outputStates
+        else:
+            return applyScalarGain(self.scalarGains[1], outputStates)
+
+    def getRevision(self):
+        """Returns the combined revision of all elements in the chain.
+        
+        Because element revisions only ever increase, their sum increases whenever any element changes.
+        
+        Note that this method overrides transformer.getRevision.
+        """
+        return sum(transformerElement.getRevision() for transformerElement in self.transformChain)
+
+    def jacobian(self, forwardState = None):
+        """Returns the derivative of the chain output with respect to its input.
+
+        forwardState -- the input state at which to evaluate the derivative. Because only chains of scalar multipliers are supported,
+                        the derivative is the same everywhere and this is ignored. It is accepted so that this method can be handed
+                        directly to numerical solvers that call jacobian(x).
+
+        Returns the combined forward gain of the chain, as a (dimensional) float. This is exact, and saves solvers from having to
+        estimate the derivative by finite differences.
+        """
+        if self.scalarGains == None:
+            raise errors.MechanismError("Jacobian is only available for chains of scalar transformers.")
+        return self.scalarGains[0]
+
+    def getScalarGains(self):
+        """Returns the pre-calculated combined forward and reverse gains of the chain.
+        
+        Returns (forwardGain, reverseGain), or None if any element in the chain is not a scalar multiplier.
+        
+        Note that this method overrides transformer.getScalarGains.
+        """
+        return self.scalarGains
+
+    def compile(self):
+        """Returns a pair of plain functions that perform the transformations of the chain on unitless floats.
+
+        This is intended for numerical code such as solvers and optimizers that call the chain many times in an inner loop, and that
+        don't need units to be carried along with every intermediate result. Inputs are assumed to be in the input units of the chain
+        in the forward direction, and in the output units of the chain in the reverse direction.
+
+        Only chains in which every element is a scalar multiplier can be compiled. The returned functions close over the combined gains
+        as plain floats and cost a single multiplication.
+
+        Returns (forwardFunction, reverseFunction), each of which accepts and returns a float.
+        """
+        if self.scalarGains == None: #at least one element is not a scalar multiplier
+            raise errors.MechanismError("Compilation is only available for chains of scalar transformers.")
+        forwardGain, reverseGain = self._forwardGainValue_, self._reverseGainValue_ #unitless, so the closures only do float math
+        return (lambda inputValue: forwardGain * inputValue), (lambda outputValue: reverseGain * outputValue)
+
+    def forwardFloat(self, forwardValue):
+        """Transforms a unitless input value of the chain into the corresponding unitless output value.
+        
+        forwardValue -- the forward-going input of the chain as a float, in the input units of the chain.
+        
+        If the chain collapses to a single scalar gain this is one float multiplication. Otherwise if every element can transform raw
+        floats, the value is passed thru each element's forwardFloat() and no dFloats are created along the way. Failing both, this
+        falls back on forward().
+        
+        Returns the output value as a float, in the output units of the chain.
+        """
+        if self.scalarGains != None: #chain collapses to a single multiplier
+            return self._forwardGainValue_ * forwardValue
+        if self._forwardFloatSteps_ == None: #at least one element only works with dFloats
+            return float(self.forward(forwardValue))
+        for forwardStep in self._forwardFloatSteps_:
+            forwardValue = forwardStep(forwardValue)
+        return forwardValue
+    
+    def reverseFloat(self, reverseValue):
+        """Transforms a unitless output value of the chain into the corresponding unitless input value.
+        
+        reverseValue -- the reverse-going output of the chain as a float, in the output units of the chain.
+        
+        Returns the input value as a float, in the input units of the chain.
+        """
+        if self.scalarGains != None: #chain collapses to a single multiplier
+            return self._reverseGainValue_ * reverseValue
+        if self._reverseFloatSteps_ == None: #at least one element only works with dFloats
+            return float(self.reverse(reverseValue))
+        for reverseStep in self._reverseFloatSteps_:
+            reverseValue = reverseStep(reverseValue)
+        return reverseValue
+
+    def calculateScalarGains(self):
+        """Combines the gains of every element in the chain into a single forward and reverse gain.
+        
+        Because the elements of the chain don't change after it is constructed, this only needs to be done once. Units are composed
+        along with the gains, so the combined gains carry the units of the whole chain.
+        
+        Returns (forwardGain, reverseGain), or None if any element in the chain is not a scalar multiplier.
+        """
+        elementGains = [transformerElement.getScalarGains() for transformerElement in self.transformChain]
+        if None in elementGains: return None #at least one element is not a scalar multiplier
+        forwardGains, reverseGains = zip(*elementGains)
+        forwardGain = functools.reduce(operator.mul, reversed(forwardGains)) #last element on the left, as when applied in sequence
+        reverseGain = functools.reduce(operator.mul, reverseGains)
+        return (forwardGain, reverseGain)
+    
     def calculateDimensions(self):
         """Determines and returns the input and output dimensions of the transformer chain.
         
@@ -533,13 +1030,31 @@ class chain(transformer):
 class stack(transformer):
     """A parallel stack of transformers."""
     
+    __slots__ = ('transformerStack', '_stackLayout_', '_forwardSlices_', '_reverseSlices_', '_laneForwardSteps_', '_laneReverseSteps_', '_laneGroups_')
+    
     def __init__(self, *transformers):
         """Initializes a new transformer stack.
         
         *transformers -- a parallel set of stacked transformers, provided in sequence from the 0th to Nth dimension.
+        
+        Any stacks provided as elements are flattened into this stack, so that transforming a state doesn't need to descend thru
+        nested stacks.
         """
+        transformers = tuple(subElement for transformerElement in transformers
+                             for subElement in (transformerElement.transformerStack if isinstance(transformerElement, stack) else (transformerElement,)))
         self.transformerStack = transformers
+        self._stackLayout_ = tuple((transformerElement,) + transformerElement.getSize() for transformerElement in transformers) #(element, outputDimension, inputDimension)
         self.dimensions = self.calculateDimensions()
+        #(step, start, end, singleAxis) for each element, so that the transforms only need to slice and call
+        self._forwardSlices_ = tuple((transformerElement.forward, stateStart, stateEnd, stateEnd - stateStart == 1) for transformerElement, stateStart, stateEnd in stackBounds(self._stackLayout_, 2))
+        self._reverseSlices_ = tuple((transformerElement.reverse, stateStart, stateEnd, stateEnd - stateStart == 1) for transformerElement, stateStart, stateEnd in stackBounds(self._stackLayout_, 1))
+        if all(transformerElement.getSize() == (1,1) for transformerElement in transformers): #every lane is single-axis, so states map one-to-one onto elements
+            self._laneForwardSteps_ = tuple(transformerElement.forward for transformerElement in transformers)
+            self._laneReverseSteps_ = tuple(transformerElement.reverse for transformerElement in transformers)
+            self._laneGroups_ = groupLanes(transformers) #runs of matching lanes, transformed together as a batch
+            if len(self._laneGroups_) == len(transformers): self._laneGroups_ = None #no lanes to group
+        else:
+            self._laneForwardSteps_, self._laneReverseSteps_, self._laneGroups_ = None, None, None
 
 
     def forward(self, forwardState):
@@ -547,45 +1062,57 @@ class stack(transformer):
         
         forwardState -- the forward-going input state of the transformer stack.
         
-        Transformation is accomplished by expanding the input state into chunks sized for each transformer in the stack.
+        Transformation is accomplished by expanding the input state into chunks sized for each transformer in the stack. If every
+        transformer in the stack is single-axis, each value of the input state is simply handed to its own transformer.
         
         Note that this function over-rides its base class transformer.forward() function.
         """
         
-        if not isinstance(forwardState, list): #if the forwardState is not provided as a list-formatted array, wrap it.
-            forwardState = [forwardState]
-        
-        outputState = [] #initialize output state as an empty list
-        for transformerElement in self.transformerStack:
-            inputDimension = transformerElement.getSize()[1]
-            if len(forwardState)>= inputDimension: #make sure there's enough input dimensions remaining
+        forwardState = stateList(forwardState) #wrap single values, and accept tuples or other sequences
+        
+        laneSteps = self._laneForwardSteps_
+        if laneSteps != None and len(forwardState) == len(laneSteps) and self._laneGroups_ != None: #matching lanes, so batch each run
+            outputState = []
+            for transformerElement, stateStart, stateEnd in self._laneGroups_:
+                outputState += transformerElement.forwardBatch(forwardState[stateStart:stateEnd])
+            return outputState
+        if laneSteps != None and len(forwardState) == len(laneSteps): #all single-axis lanes, so transform each value by its own lane
+            outputState = [laneStep(laneState) for laneStep, laneState in zip(laneSteps, forwardState)]
+            return outputState[0] if len(outputState) == 1 else outputState
+        
+        outputState = [None]*self.dimensions[0] #preallocate the output state, and fill it in place
+        writeIndex = 0 #position of the next unfilled value in outputState
+        stateLength = len(forwardState)
+        for transformerStep, stateStart, stateEnd, singleAxis in self._forwardSlices_:
+            if stateLength >= stateEnd: #make sure there's enough input dimensions remaining
                 
-                if inputDimension == 1: #single-axis, so feed with dFloat rather than list.
-                    forwardSubState = forwardState[0] #feed first value of forwardState
-                    forwardState = forwardState[1:] #forwardState gets first value stripped
-                    outputSubState = transformerElement.forward(forwardSubState) #perform transform to get output segment state
+                if singleAxis: #single-axis, so feed with dFloat rather than list.
+                    forwardSubState = forwardState[stateStart] #feed next value of forwardState
+                    outputSubState = transformerStep(forwardSubState) #perform transform to get output segment state
                 else: #multi-axis, feed with a list
-                    forwardSubState = forwardState[0:inputDimension]
-                    forwardState = forwardState[inputDimension:]
-                    outputSubState = transformerElement.forward(forwardSubState)
+                    forwardSubState = forwardState[stateStart:stateEnd]
+                    outputSubState = transformerStep(forwardSubState)
                 
-                if not isinstance(outputSubState, list): #output state is not a list, so wrap
-                    outputState += [outputSubState]
+                if hasattr(outputSubState, '__len__'): #multi-axis result, so copy into the next slots
+                    outputState[writeIndex:writeIndex + len(outputSubState)] = outputSubState
+                    writeIndex += len(outputSubState)
                 else:
-                    outputState += outputSubState 
+                    outputState[writeIndex] = outputSubState
+                    writeIndex += 1
 
             else:
-                utilities.notice(self, "Cannot perform transform because dimension of forward state is less than input dimension of transformer.")
-                raise errors.MechanismError("Encountered dimensionality mismatch while attempting transform.")                
+                utilities.debugNotice(self, 'mechanics', "Cannot perform transform because dimension of forward state is less than input dimension of transformer.")
+                raise errors.MechanismError("Encountered dimensionality mismatch while attempting transform: expected " + str(self.dimensions[1]) + " values, but received " + str(stateLength) + ".")
         
-        if len(forwardState) == 0: 
+        if stateLength == self.dimensions[1]: #all input was consumed
+            del outputState[writeIndex:] #trim any unfilled slots
             if len(outputState) == 1: 
                 return outputState[0] #single element, so strip away list
             else: 
                 return outputState 
         else: #uh oh! some input is left over
-            utilities.notice(self, "Cannot perform transform because dimension of forward state is greater than input dimension of transformer.")
-            raise errors.MechanismError("Encountered dimensionality mismatch while attempting transform.")               
+            utilities.debugNotice(self, 'mechanics', "Cannot perform transform because dimension of forward state is greater than input dimension of transformer.")
+            raise errors.MechanismError("Encountered dimensionality mismatch while attempting transform: expected " + str(self.dimensions[1]) + " values, but received " + str(stateLength) + ".")
 
 
     def reverse(self, outputState):
@@ -597,42 +1124,84 @@ class stack(transformer):
         
         Note that this function over-rides its base class transformer.reverse() function.
         """
-        if not isinstance(outputState, list): #if the forwardState is not provided as a list-formatted array, wrap it.
-            outputState = [outputState]
-        
-        inputState = [] #initialize input state as an empty list
-        for transformerElement in self.transformerStack:
-            outputDimension = transformerElement.getSize()[0]
-            if len(outputState)>= outputDimension: #make sure there's enough input dimensions remaining
+        outputState = stateList(outputState) #wrap single values, and accept tuples or other sequences
+        
+        laneSteps = self._laneReverseSteps_
+        if laneSteps != None and len(outputState) == len(laneSteps) and self._laneGroups_ != None: #matching lanes, so batch each run
+            inputState = []
+            for transformerElement, stateStart, stateEnd in self._laneGroups_:
+                inputState += transformerElement.reverseBatch(outputState[stateStart:stateEnd])
+            return inputState
+        if laneSteps != None and len(outputState) == len(laneSteps): #all single-axis lanes, so transform each value by its own lane
+            inputState = [laneStep(laneState) for laneStep, laneState in zip(laneSteps, outputState)]
+            return inputState[0] if len(inputState) == 1 else inputState
+        
+        inputState = [None]*self.dimensions[1] #preallocate the input state, and fill it in place
+        writeIndex = 0 #position of the next unfilled value in inputState
+        stateLength = len(outputState)
+        for transformerStep, stateStart, stateEnd, singleAxis in self._reverseSlices_:
+            if stateLength >= stateEnd: #make sure there's enough input dimensions remaining
                 
-                if outputDimension == 1: #single-axis, so feed with dFloat rather than list.
-                    outputSubState = outputState[0] #feed first value of outputState
-                    outputState = outputState[1:] #outputState gets first value stripped
-                    inputSubState = transformerElement.reverse(outputSubState) #perform transform to get input segment state
+                if singleAxis: #single-axis, so feed with dFloat rather than list.
+                    outputSubState = outputState[stateStart] #feed next value of outputState
+                    inputSubState = transformerStep(outputSubState) #perform transform to get input segment state
                 else: #multi-axis, feed with a list
-                    outputSubState = outputState[0:outputDimension]
-                    outputState = outputState[outputDimension:]
-                    inputSubState = transformerElement.reverse(outputSubState)
+                    outputSubState = outputState[stateStart:stateEnd]
+                    inputSubState = transformerStep(outputSubState)
                 
-                if not isinstance(inputSubState, list): #input state is not a list, so wrap
-                    inputState += [inputSubState]
+                if hasattr(inputSubState, '__len__'): #multi-axis result, so copy into the next slots
+                    inputState[writeIndex:writeIndex + len(inputSubState)] = inputSubState
+                    writeIndex += len(inputSubState)
                 else:
-                    inputState += inputSubState 
+                    inputState[writeIndex] = inputSubState
+                    writeIndex += 1
 
             else:
-                utilities.notice(self, "Cannot perform transform because dimension of forward state is less than input dimension of transformer.")
-                raise errors.MechanismError("Encountered dimensionality mismatch while attempting transform.")                
+                utilities.debugNotice(self, 'mechanics', "Cannot perform transform because dimension of forward state is less than input dimension of transformer.")
+                raise errors.MechanismError("Encountered dimensionality mismatch while attempting transform: expected " + str(self.dimensions[0]) + " values, but received " + str(stateLength) + ".")
         
-        if len(outputState) == 0: 
+        if stateLength == self.dimensions[0]: #all output was consumed
+            del inputState[writeIndex:] #trim any unfilled slots
             if len(inputState) == 1: 
                 return inputState[0] #single element, so strip away list
             else: 
                 return inputState 
         else: #uh oh! some input is left over
-            utilities.notice(self, "Cannot perform transform because dimension of forward state is greater than input dimension of transformer.")
-            raise errors.MechanismError("Encountered dimensionality mismatch while attempting transform.")               
+            utilities.debugNotice(self, 'mechanics', "Cannot perform transform because dimension of forward state is greater than input dimension of transformer.")
+            raise errors.MechanismError("Encountered dimensionality mismatch while attempting transform: expected " + str(self.dimensions[0]) + " values, but received " + str(stateLength) + ".")
           
           
+    def roundTrip(self, outputState):
+        """Transforms an output state in reverse and then forward again, returning the resulting output state.
+        
+        outputState -- the reverse-going output state of the transformer stack.
+        
+        Each element of the stack transforms its own portion of the output state in reverse and then forward, one element at a time,
+        so the intermediate input state of the whole stack is never assembled.
+        
+        Note that this function over-rides its base class transformer.roundTrip() function.
+        """
+        outputState = stateList(outputState) #wrap single values, and accept tuples or other sequences
+        stateLength = len(outputState)
+        if stateLength != self.dimensions[0]:
+            utilities.debugNotice(self, 'mechanics', "Cannot perform transform because dimension of output state does not match output dimension of transformer.")
+            raise errors.MechanismError("Encountered dimensionality mismatch while attempting transform: expected " + str(self.dimensions[0]) + " values, but received " + str(stateLength) + ".")
+        
+        roundTripState = [None]*self.dimensions[0] #preallocate, and fill in place
+        for transformerElement, (reverseStep, stateStart, stateEnd, singleAxis) in zip(self.transformerStack, self._reverseSlices_):
+            if singleAxis: #single-axis, so feed with dFloat rather than list.
+                roundTripState[stateStart] = transformerElement.roundTrip(outputState[stateStart])
+            else:
+                roundTripState[stateStart:stateEnd] = transformerElement.roundTrip(outputState[stateStart:stateEnd])
+        return roundTripState[0] if len(roundTripState) == 1 else roundTripState
+
+    def getRevision(self):
+        """Returns the combined revision of all transformers in the stack.
+        
+        Note that this method overrides transformer.getRevision.
+        """
+        return sum(transformerElement.getRevision() for transformerElement in self.transformerStack)
+
     def calculateDimensions(self):
         """Determines and returns the input and output dimensions of the transformer stack.
         
@@ -646,19 +1215,188 @@ class stack(transformer):
         """
         inputDimension = 0
         outputDimension = 0
-        for transformerElement in self.transformerStack:
-            outputSize, inputSize = transformerElement.getSize()
+        for transformerElement, outputSize, inputSize in self._stackLayout_: #element sizes were already collected at construction
             outputDimension += outputSize
             inputDimension += inputSize
         
         return (outputDimension, inputDimension)
 
 
-def gang(transformer):
+def stateList(state):
+    """Returns a state formatted as a list.
+    
+    state -- a single value, or a list, tuple, or other sequence of values.
+    
+    Lists are returned as-is, other sequences are copied into a list, and single values are wrapped in a list.
+    """
+    if isinstance(state, list): return state
+    try:
+        return list(state)
+    except TypeError: #not a sequence, so a single value
+        return [state]
+
+
+def stackBounds(stackLayout, dimensionIndex):
+    """Returns the slice of a stacked state that belongs to each element of a stack.
+    
+    stackLayout -- a sequence of (element, outputDimension, inputDimension) tuples, in stack order
+    dimensionIndex -- 1 to lay out the output state, or 2 to lay out the input state
+    
+    Returns a tuple of (element, start, end) tuples, where state[start:end] is the portion of the state handled by the element.
+    """
+    stackBounds = []
+    stateStart = 0
+    for layoutEntry in stackLayout:
+        stateEnd = stateStart + layoutEntry[dimensionIndex]
+        stackBounds += [(layoutEntry[0], stateStart, stateEnd)]
+        stateStart = stateEnd
+    return tuple(stackBounds)
+
+
+def groupLanes(transformers):
+    """Groups runs of matching single-axis transformers in a stack, so that each run can be transformed as a batch.
+    
+    transformers -- a sequence of single-axis transformers, in stack order
+    
+    Two neighboring transformers match if they are the same object, or if they are of the same type and have scalar gains with equal
+    values and equivalent units. Units are compared by their composition rather than by identity, so that e.g. several separately
+    built but otherwise identical chains are grouped together.
+    
+    Returns a tuple of (transformer, start, end) tuples, where state[start:end] holds the states of the run.
+    """
+    laneGroups = []
+    for laneIndex, transformerElement in enumerate(transformers):
+        if laneGroups and sameLane(laneGroups[-1][0], transformerElement): #extend the current run
+            laneGroups[-1] = (laneGroups[-1][0], laneGroups[-1][1], laneIndex + 1)
+        else:
+            laneGroups += [(transformerElement, laneIndex, laneIndex + 1)]
+    return tuple(laneGroups)
+
+
+def sameLane(transformerA, transformerB):
+    """Returns True if two transformers are guaranteed to transform any state identically."""
+    if transformerA is transformerB: return True
+    if type(transformerA) is not type(transformerB): return False
+    gainsA, gainsB = transformerA.getScalarGains(), transformerB.getScalarGains()
+    if gainsA == None or gainsB == None: return False
+    for gainA, gainB in zip(gainsA, gainsB):
+        if float(gainA) != float(gainB): return False
+        unitsA, unitsB = getattr(gainA, 'units', None), getattr(gainB, 'units', None)
+        if unitsA is unitsB: continue #same unit object, or both unitless
+        if unitsA == None or unitsB == None: return False
+        if unitsA.primary_unitdict != unitsB.primary_unitdict: return False #compare by value, since each chain composes its own gain units
+    return True
+
+
+def applyMatrixRows(matrixRows, state):
+    """Multiplies a state by a matrix, provided as a sequence of rows.
+    
+    matrixRows -- a sequence of matrix rows, each of which is a sequence with one value per input.
+    state -- a list-formatted single-row array containing the input state.
+    
+    This is equivalent to multiplying the matrix by the state as a column matrix, and is carried out in the same order as
+    geometry.matrixMultiply so that units are handled identically.
+    
+    Returns the resulting state as a list.
+    """
+    if not isinstance(state, list):
+        raise errors.MatrixError("Matrix transformer state must be provided as a list-formatted array.")
+    if matrixRows and len(matrixRows[0]) != len(state):
+        raise errors.MatrixError("Cannot multiply matrices because the numbers of columns of the left matrix don't equal the number of rows of the right matrix ")
+    outputState = []
+    for row in matrixRows:
+        runningDotProduct = 0
+        for rowValue, stateValue in zip(row, state):
+            runningDotProduct += rowValue*stateValue
+        outputState += [runningDotProduct]
+    return outputState
+
+
+def memoKey(state):
+    """Returns a hashable key that identifies a state by value and units.
+    
+    state -- a single value or list-formatted array of values
+    
+    Single values produce a (value, units) tuple, where units is None for plain numbers. Lists produce a tuple of the keys of their items.
+    """
+    if isinstance(state, list):
+        return tuple(memoKey(subState) for subState in state)
+    return (float(state), getattr(state, 'units', None))
+
+
+def applyScalarGain(gain, states):
+    """Multiplies each of a sequence of states by a scalar gain.
+    
+    gain -- a float or units.dFloat
+    states -- a list of floats or units.dFloats
+    
+    The units of each product are only composed when the units of the input state change from the previous state, rather than for
+    every state. This makes multiplying a long sequence of states with matching units much cheaper than multiplying each individually.
+    
+    Returns a list of products.
+    """
+    gainValue = float(gain)
+    outputStates = []
+    lastInputUnits, lastOutputUnits = None, None
+    for state in states:
+        if isinstance(state, units.dFloat):
+            if state.units is not lastInputUnits: #only compose units when they change
+                lastInputUnits, lastOutputUnits = state.units, (gain * state).units
+            outputStates += [units.dFloat(gainValue * float(state), lastOutputUnits)]
+        else:
+            outputStates += [gain * state]
+    return outputStates
+
+
+class gang(transformer):
     """Reduces the outputs of multiple single-axis transformers to one dimension.
     
     This object will convert multiple inputs to a single output, and is useful for e.g. machines that rely on multiple 
     linear actuators moving in synchrony to maintain parallelism. This type of arrangement can be found on many varieties
     of hobbyist-grade 3D printers and CNC machines.
     """
-    pass
+    
+    __slots__ = ('weights',)
+    
+    def __init__(self, inputCount, weights = None):
+        """Initializes the gang.
+        
+        inputCount -- the number of ganged inputs.
+        weights -- an optional list of the weight given to each input when reducing them to the output. By default each input is
+                   weighted equally, so the output is the mean of the inputs.
+        """
+        if inputCount < 1:
+            utilities.notice(self, "A gang must have at least one input, but " + str(inputCount) + " were requested.")
+            raise errors.MechanismError("Unable to initialize gang.")
+        if weights == None:
+            weights = [1.0/inputCount for inputIndex in range(inputCount)]
+        if len(weights) != inputCount:
+            utilities.notice(self, "Provided " + str(len(weights)) + " weights, but the gang has " + str(inputCount) + " inputs.")
+            raise errors.MechanismError("Unable to initialize gang.")
+        self.weights = tuple(float(weight) for weight in weights)
+        self.dimensions = self.calculateDimensions()
+    
+    def calculateDimensions(self):
+        """Calculates and returns the dimensions of the gang, which has one output and one input per weight."""
+        return (1, len(self.weights))
+    
+    def forward(self, forwardState):
+        """Transform in the forward direction.
+        
+        forwardState -- a list-formatted array containing one input state per ganged input.
+        
+        Returns the weighted sum of the inputs.
+        """
+        if not isinstance(forwardState, list) or len(forwardState) != len(self.weights):
+            utilities.notice(self, "Forward state must be a list with one value for each of the " + str(len(self.weights)) + " ganged inputs.")
+            raise errors.MechanismError("Encountered dimensionality mismatch while attempting transform.")
+        return functools.reduce(operator.add, [weight*stateValue for weight, stateValue in zip(self.weights, forwardState)]) #reduce rather than sum, so units are kept
+    
+    def reverse(self, reverseState):
+        """Transform in the reverse direction.
+        
+        reverseState -- the output state of the gang.
+        
+        Every ganged input follows the output, so the output state is simply copied to each input.
+        """
+        return [reverseState]*len(self.weights)
@@ -4,13 +4,12 @@
 
 
 #---- INCLUDES ----
-import threading, queue
+import threading, collections
 import time
-import imp, os, urllib.request, urllib.parse, urllib.error  #for importing files
-import copy
+import os  #for importing files. imp and urllib are imported by the shell methods that load nodes, since most sessions never need them.
 from pygestalt import core, packets, utilities, interfaces, config
 from pygestalt.utilities import notice, debugNotice
-import functools
+import functools, operator
 import inspect, types
 
 
@@ -65,37 +64,18 @@ class baseGestaltVirtualNode(baseVirtualNode):
         """
         
         self._outboundPortTable_ = {}   #stores function:port pairs as assigned by bindPort
-        self._inboundPortTable_ = {} #stores port:function pairs as assigned by bindPort
+        self._inboundPortTable_ = [None]*256 #stores the function bound to each port by bindPort, indexed by port number
         
         #-- Parse Optional Initialization Parameters --
-        self._originalInitArgs_ = copy.copy(args)  #store original arguments for _updateVirtualNode_
-        self._originalInitKwargs_ = copy.copy(kwargs)
-        
-        if "name" in kwargs:
-            self._name_ = kwargs.pop("name")    #pop name from named arguments, and set as node name. This is used by utilities.notice and for persistence.
-        else:
-            self._name_ = None  #default value
-            
-        if "interface" in kwargs:
-            self._interface_ = kwargs.pop("interface")      #the interface on which the node will communicate
-        else:
-            self._interface_ = None
-        
-        if "_shell_" in kwargs:
-            self._shell_ = kwargs.pop("_shell_")        #if provided, this virtual node has a node shell
-        else:
-            self._shell_ = None
-            
-        if "synthetic" in kwargs:
-            syntheticArg = kwargs.pop("synthetic")     #synthetic argument has been provided.
-        else:
-            syntheticArg = False    #no synthetic argument provided, default to false
-        
-        if syntheticArg == True:    #now that syntheticArg is guaranteed to exist, check if True, and if so, put node in synthetic mode
-            self._syntheticMode_ = True
-        else:
-            self._syntheticMode_ = False
-            
+        self._originalInitArgs_ = args  #store original arguments for _updateVirtualNode_. args is a tuple, so needn't be copied.
+        self._originalInitKwargs_ = dict(kwargs)  #shallow copy, since options are popped from kwargs below
+        self._nodeURL_ = None   #URL returned by the physical node, cached by _updateVirtualNode_ so that it is only requested once
+        
+        self._name_ = kwargs.pop("name", None)    #pop name from named arguments, and set as node name. This is used by utilities.notice and for persistence.
+        self._interface_ = kwargs.pop("interface", None)      #the interface on which the node will communicate
+        self._shell_ = kwargs.pop("_shell_", None)        #if provided, this virtual node has a node shell
+        self._syntheticMode_ = (kwargs.pop("synthetic", False) == True)     #if the synthetic argument is True, put node in synthetic mode
+
         #-- Initialization--
         utilities.callFunctionAcrossMRO(self, "init", args, kwargs)
         utilities.callFunctionAcrossMRO(self, "initPackets")
@@ -209,13 +189,15 @@ class baseGestaltVirtualNode(baseVirtualNode):
         if self._shell_._nodeLoaded_:   #a non-default node is already loaded into the shell.
             return False
 
-        nodeURL = self.urlRequest() #get node URL
+        if self._nodeURL_ == None: #only request the URL from the physical node once
+            self._nodeURL_ = self.urlRequest() #get node URL
+        nodeURL = self._nodeURL_
         
         if config.automaticNodeDownload(): #automatic node downloads are enabled
             return self._shell_._loadNodeFromURL_(nodeURL, args, kwargs) #load from URL
         else: #load from local file
-            vnFilename = os.path.basename(URL) #get filename based on URL
-            return self._loadNodeFromFile_(vnFilename, args, kwargs) #load from file
+            vnFilename = os.path.basename(nodeURL) #get filename based on URL
+            return self._shell_._loadNodeFromFile_(vnFilename, args, kwargs) #load from file
 
     def bindPort(self, port, outboundFunction = None, outboundTemplate = None, inboundFunction = None, inboundTemplate = None ):
         """Attaches actionObject classes and templates to a communication port, and initializes relevant parameters.
@@ -231,25 +213,8 @@ class baseGestaltVirtualNode(baseVirtualNode):
         Note that the parameter names contain the reference "function" strictly for the benefit of the user, since in practice they behave like functions.
         """
         
-        inboundPacketFlagQueue =  queue.Queue()   #This queue is used to store an actionObject that should be flagged when a reply has been received.
-        
-        #GENERATE actionObject CLASSES
-        if outboundFunction != None:    #an outbound function has been provided
-            outboundActionObjectClass = self._addDerivedType_(outboundFunction)   #this is the class that will actually get called to instantiate action objects
-                                                                                #during use. It is a derived class of the provided outboundFunction class. 
-            outboundActionObjectClass._baseActionObject_ = outboundFunction            #store the base class for introspection use later
-        else: #no outbound function has been provided, must generate one.
-            typeName = "outboundActionObjectOnPort"+ str(port)    #make up a name that is unique
-            outboundActionObjectClass = self._addDerivedType_(core.genericOutboundActionObjectBlockOnReply, typeName)
-            outboundActionObjectClass._baseActionObject_ = core.genericOutboundActionObjectBlockOnReply
-        
-        if inboundFunction != None: #an inbound function has been provided
-            inboundActionObjectClass = self._addDerivedType_(inboundFunction)
-            inboundActionObjectClass._baseActionObject_ = inboundFunction
-        else: #no inbound function has been provided, must generate one
-            typeName = "inboundActionObjectOnPort" + str(port)    #make up a name that is unique
-            inboundActionObjectClass = self._addDerivedType_(core.genericInboundActionObject, typeName)
-            inboundActionObjectClass._baseActionObject_ = inboundFunction
+        inboundPacketFlagQueue =  collections.deque()   #This queue is used to store an actionObject that should be flagged when a reply has been received.
+                                                        #Only non-blocking access is needed, and deque appends and pops are atomic.
         
         #GENERATE MISSING PACKET TEMPLATES
         if outboundTemplate == None:
@@ -260,29 +225,39 @@ class baseGestaltVirtualNode(baseVirtualNode):
             templateName = 'inboundTemplateOnPort' + str(port)
             inboundTemplate = packets.emptyTemplate(templateName)
         
-        #STORE PARAMETERS IN actionObject CLASSES
-        outboundActionObjectClass._inboundPacketFlagQueue_ = inboundPacketFlagQueue #store a reference to inbound packet flag queue
-        inboundActionObjectClass._inboundPacketFlagQueue_ = inboundPacketFlagQueue
-        
-        outboundActionObjectClass._outboundTemplate_ = outboundTemplate #store outbound packet template
-        inboundActionObjectClass._outboundTemplate_ = outboundTemplate
+        #PARAMETERS TO STORE IN actionObject CLASSES. These are provided when each class is created, rather than set afterwards.
+        classAttributes = {'_inboundPacketFlagQueue_': inboundPacketFlagQueue,  #reference to inbound packet flag queue
+                           '_outboundTemplate_': outboundTemplate,  #outbound packet template
+                           '_inboundTemplate_': inboundTemplate,    #inbound packet template
+                           'virtualNode': self}
         
-        outboundActionObjectClass._inboundTemplate_ = inboundTemplate #store inbound packet template
-        inboundActionObjectClass._inboundTemplate_ = inboundTemplate
+        #GENERATE actionObject CLASSES
+        if outboundFunction != None:    #an outbound function has been provided
+            #this is the class that will actually get called to instantiate action objects during use. It is a derived class of the provided outboundFunction class.
+            #The base class is stored for introspection use later.
+            outboundActionObjectClass = self._addDerivedType_(outboundFunction, classAttributes = dict(classAttributes, _baseActionObject_ = outboundFunction))
+        else: #no outbound function has been provided, must generate one.
+            typeName = "outboundActionObjectOnPort"+ str(port)    #make up a name that is unique
+            outboundActionObjectClass = self._addDerivedType_(core.genericOutboundActionObjectBlockOnReply, typeName,
+                                                              dict(classAttributes, _baseActionObject_ = core.genericOutboundActionObjectBlockOnReply))
         
-        outboundActionObjectClass.virtualNode = self
-        inboundActionObjectClass.virtualNode = self
+        if inboundFunction != None: #an inbound function has been provided
+            inboundActionObjectClass = self._addDerivedType_(inboundFunction, classAttributes = dict(classAttributes, _baseActionObject_ = inboundFunction))
+        else: #no inbound function has been provided, must generate one
+            typeName = "inboundActionObjectOnPort" + str(port)    #make up a name that is unique
+            inboundActionObjectClass = self._addDerivedType_(core.genericInboundActionObject, typeName, dict(classAttributes, _baseActionObject_ = inboundFunction))
         
         #UPDATE VIRUAL NODE PORT DICTIONARIES
-        self._outboundPortTable_.update({outboundActionObjectClass:port})
-        self._inboundPortTable_.update({port:inboundActionObjectClass})
+        self._outboundPortTable_[outboundActionObjectClass] = port
+        self._inboundPortTable_[port] = inboundActionObjectClass
     
-    def _addDerivedType_(self, baseClass, name = None):
+    def _addDerivedType_(self, baseClass, name = None, classAttributes = {}):
         """Creates a new type using baseClass as the base, and adds the baseClass entry in self.__dict__.
         
         baseClass -- the parent class from which to make a derived type.
         name -- if provided, this is the name that should be assigned to the class. If not provided,
                 the baseClass __name__ will be used instead.
+        classAttributes -- a dictionary of class attributes to define in the new type as it is created.
         
         This is an ugly thing to do, but is necessary because of the way Gestalt should work. The user
         can define actionObject classes in the virtual node. When a call gets made to the class, an
@@ -301,7 +276,7 @@ class baseGestaltVirtualNode(baseVirtualNode):
         else:   #reuse name of base class
             typeName = baseClass.__name__
             
-        newType = type(typeName,(baseClass,) ,{}) #create new type
+        newType = type(typeName,(baseClass,) ,dict(classAttributes)) #create new type
         self.__dict__.update({typeName:newType})
         return newType
     
@@ -311,19 +286,21 @@ class baseGestaltVirtualNode(baseVirtualNode):
         actionObject -- the action object to look up in the node's outbound port table.
         Returns the port number if avaliable, otherwise returns False
         """
-        if type(actionObject) in self._outboundPortTable_:
-            return self._outboundPortTable_[type(actionObject)]
-        else:
+        port = self._outboundPortTable_.get(type(actionObject))
+        if port == None:
             notice(self, "actionObject type " + str(type(actionObject)) + "is not bound to this node.")
             return False
+        else:
+            return port
     
     def _getInboundActionObjectFromPortNumber_(self, portNumber):
         """Returns the actionObject type that is bound to an input port number.
         
         portNumber -- the port number of the actionObject to be returned
         """
-        if portNumber in self._inboundPortTable_:
-            return self._inboundPortTable_[portNumber]
+        actionObjectClass = self._inboundPortTable_[portNumber]
+        if actionObjectClass != None:
+            return actionObjectClass
         else:
             notice(self, "No actionObject type is bound to port number " + str(portNumber) + " on this node.")
             return False
@@ -334,10 +311,14 @@ class baseGestaltVirtualNode(baseVirtualNode):
         port -- the port of the target actionObject type
         packet -- a serialized payload packet aimed at the target actionObject type
         """
-        actionObjectClass = self._getInboundActionObjectFromPortNumber_(port) #get the actionObject class
+        actionObjectClass = self._inboundPortTable_[port] #get the actionObject class. Looked up directly, since this runs for every inbound packet.
+        if actionObjectClass == None:
+            notice(self, "No actionObject type is bound to port number " + str(port) + " on this node.")
+            return False
         
-        actionObjectName = actionObjectClass.__name__
-        debugNotice(self, "_gestaltNodeInboundRouter_", actionObjectName + " on port " + str(port) + " (inbound)")        
+        if utilities.debugEnabled("_gestaltNodeInboundRouter_"):   #only build the debug string if it will be printed
+            actionObjectName = actionObjectClass.__name__
+            debugNotice(self, "_gestaltNodeInboundRouter_", actionObjectName + " on port " + str(port) + " (inbound)")        
         
         #make a call to the inbound action object first
         inboundActionObject = actionObjectClass()   #instantiate a new inbound action object
@@ -386,54 +367,76 @@ class gestaltVirtualNode(baseGestaltVirtualNode):
         """Initialiation routine for gestalt node."""
         self.bootPageSize = 128     #bootloader page size in bytes
         self.bootloaderSupport = True   #default is that node supports a bootloader. For arduino-based nodes this should be set to false by the child node.
+        self._statusCache_ = None   #(time, status, appValid) from the last successful statusRequest. Cleared by any request that may change the status.
     
         #synthetic node parameters
         self.synApplicationMemorySize = 32768  #application memory size in bytes. Used for synthetic responses
-        self.synApplicationMemory = [255 for bytePosition in range(self.synApplicationMemorySize)]  #used for synthetic bootloader program load
+        self.synApplicationMemory = bytearray(b'\xff' * self.synApplicationMemorySize)  #used for synthetic bootloader program load. Erased flash reads as 0xFF.
         self.synNodeURL = "http://www.pygestalt.org/vn/testNode.py"  #fake URL
         self.synNodeAddress = 0 #synthetic node address. Note that eventually will need synthetic node address persistence.
     
+    _packetTemplateCache_ = {}  #bootPageSize:packet templates, shared by all nodes with the same bootloader page size
+    
     def initPackets(self):
-        """Define packet templates."""
+        """Define packet templates.
         
-        #Node Status
-        self.statusResponsePacket = packets.template('statusResponse',
+        The templates only depend on the bootloader page size and aren't modified once created, so they are built by
+        _buildPacketTemplates_ the first time a page size is encountered, and then shared by every node with that page size.
+        """
+        packetTemplates = self._packetTemplateCache_.get(self.bootPageSize)
+        if packetTemplates == None: #first node with this page size, so build the templates
+            packetTemplates = self._buildPacketTemplates_(self.bootPageSize)
+            self._packetTemplateCache_[self.bootPageSize] = packetTemplates
+        self.__dict__.update(packetTemplates)
+    
+    @staticmethod
+    def _buildPacketTemplates_(bootPageSize):
+        """Builds the packet templates used by the standard Gestalt node.
+        
+        bootPageSize -- the bootloader page size in bytes
+        
+        Returns a dictionary of templateName:template pairs.
+        """
+        return {
+            #Node Status
+            'statusResponsePacket': packets.template('statusResponse',
                                                      packets.pString('status', 1),  #status is encoded as 'b' for bootloader, and 'a' for application
-                                                     packets.unsignedInt('appValidity', 1)) #application validity byte, gets set to 170 if valid
+                                                     packets.unsignedInt('appValidity', 1)), #application validity byte, gets set to 170 if valid
         
-        #Bootloader Command
-        self.bootCommandRequestPacket = packets.template('bootCommandRequest',
-                                                         packets.unsignedInt('commandCode', 1))
+            #Bootloader Command
+            'bootCommandRequestPacket': packets.template('bootCommandRequest',
+                                                         packets.unsignedInt('commandCode', 1)),
         
-        self.bootCommandResponsePacket = packets.template('bootCommandResponse',
+            'bootCommandResponsePacket': packets.template('bootCommandResponse',
                                                           packets.unsignedInt('responseCode', 1),
-                                                          packets.unsignedInt('pageNumber', 2))
-        #Bootloader Write
-        self.bootWriteRequestPacket = packets.template('bootWriteRequest',
+                                                          packets.unsignedInt('pageNumber', 2)),
+            #Bootloader Write
+            'bootWriteRequestPacket': packets.template('bootWriteRequest',
                                                        packets.unsignedInt('commandCode', 1),
                                                        packets.unsignedInt('pageNumber', 2),
-                                                       packets.pList('writeData', self.bootPageSize))
+                                                       packets.pList('writeData', bootPageSize)),
         
-        self.bootWriteResponsePacket = packets.template('bootWriteResponse',
+            'bootWriteResponsePacket': packets.template('bootWriteResponse',
                                                         packets.unsignedInt('responseCode', 1),
-                                                        packets.unsignedInt('pageNumber', 2))
-        #Bootloader Read
-        self.bootReadRequestPacket = packets.template('bootReadRequest',
-                                                      packets.unsignedInt('pageNumber',2))
+                                                        packets.unsignedInt('pageNumber', 2)),
+            #Bootloader Read
+            'bootReadRequestPacket': packets.template('bootReadRequest',
+                                                      packets.unsignedInt('pageNumber',2)),
         
-        self.bootReadResponsePacket = packets.template('bootReadResponse',
-                                                       packets.pList('readData', self.bootPageSize))
+            'bootReadResponsePacket': packets.template('bootReadResponse',
+                                                       packets.pList('readData', bootPageSize)),
         
-        #Request URL
-        self.urlResponsePacket = packets.template('urlResponse',
-                                                  packets.pString('URL'))
+            #Request URL
+            'urlResponsePacket': packets.template('urlResponse',
+                                                  packets.pString('URL')),
         
-        #Set Address
-        self.setAddressRequestPacket = packets.template('setAddressRequest',
-                                                   packets.unsignedInt('setAddress', 2))
+            #Set Address
+            'setAddressRequestPacket': packets.template('setAddressRequest',
+                                                   packets.unsignedInt('setAddress', 2)),
         
-        self.setAddressResponsePacket = packets.template('setAddressResponse',
+            'setAddressResponsePacket': packets.template('setAddressResponse',
                                                     packets.pString('URL'))
+            }
         
     def initPorts(self):
         """Bind ports to functions and packet templates."""
@@ -495,25 +498,25 @@ class gestaltVirtualNode(baseGestaltVirtualNode):
                 return False
         #initialize bootloader
         if self.initBootload(): notice(self, "BOOTLOADER INITIALIZED!")
+        #extract the address and data of each page once, for use by both the write and verify passes
+        pageAddresses = [page[0][0] for page in pages]
+        pageContents = [bytes(map(operator.itemgetter(1), page)) for page in pages]
         #write hex file to node
-        for page in pages:
-            pageData = [addressBytePair[1] for addressBytePair in page]
-            pageNumber = self.bootWriteRequest(page[0][0], pageData)    #send page to bootloader
-            if pageNumber != page[0][0]:
-                notice(self, "Error in Bootloader: PAGE MISMATCH: SENT PAGE " + str(page[0][0]) + " AND NODE REPORTED PAGE " + str(pageNumber))
+        for pageAddress, pageData in zip(pageAddresses, pageContents):
+            pageNumber = self.bootWriteRequest(pageAddress, list(pageData))    #send page to bootloader. Packets are encoded from lists of bytes.
+            if pageNumber != pageAddress:
+                notice(self, "Error in Bootloader: PAGE MISMATCH: SENT PAGE " + str(pageAddress) + " AND NODE REPORTED PAGE " + str(pageNumber))
                 notice(self, "ABORTING PROGRAM LOAD")
                 return False
             notice(self, "WROTE PAGE "+ str(pageNumber))# + ": " + str(pageData)
         #verify hex file from node
-        for page in pages:
-            pageData = [addressBytePair[1] for addressBytePair in page]
-            currentPageNumber = page[0][0]
-            verifyData = self.bootReadRequest(currentPageNumber)
-            for index, item in enumerate(verifyData):
-                if item != pageData[index]:
-                    notice(self, "VERIFY ERROR IN PAGE: "+ str(currentPageNumber)+ " BYTE: "+ str(index))
-                    notice(self, "VERIFY FAILED")
-                    return False
+        for currentPageNumber, pageData in zip(pageAddresses, pageContents):
+            verifyData = bytes(self.bootReadRequest(currentPageNumber))
+            if verifyData != pageData: #compare whole page at once, and only search for the mismatched byte on failure
+                index = next((index for index, (readByte, pageByte) in enumerate(zip(verifyData, pageData)) if readByte != pageByte), min(len(verifyData), len(pageData)))
+                notice(self, "VERIFY ERROR IN PAGE: "+ str(currentPageNumber)+ " BYTE: "+ str(index))
+                notice(self, "VERIFY FAILED")
+                return False
             notice(self, "PAGE " + str(currentPageNumber) + " VERIFIED!")
         notice(self, "VERIFY PASSED")
         #start application
@@ -541,7 +544,7 @@ class gestaltVirtualNode(baseGestaltVirtualNode):
         Returns True if successful, or False if unsuccessful.
         """
         
-        nodeStatus, appValid = self.statusRequest() #get current status of node
+        nodeStatus, appValid = self.cachedStatusRequest() #get current status of node
         
         if enforceValidity:
             if not appValid:    #application is not valid
@@ -557,6 +560,22 @@ class gestaltVirtualNode(baseGestaltVirtualNode):
                 return True
 
 
+    def cachedStatusRequest(self, maxAge = 0.25):
+        """Returns the node status, re-using the result of a recent statusRequest if available.
+        
+        maxAge -- the age in seconds beyond which a previous status is considered stale, and a new statusRequest is issued.
+        
+        Requests that can change the node status clear the cached status, so this only saves round-trips when the status is checked
+        repeatedly in quick succession. Keep maxAge short so that any other change in the node's status is noticed promptly.
+        
+        Returns status, appValid as provided by statusRequest.
+        """
+        if self._statusCache_ != None:
+            statusTime, status, appValid = self._statusCache_
+            if time.monotonic() - statusTime < maxAge: #recent enough to re-use
+                return status, appValid
+        return self.statusRequest()
+
     # --- actionObjects ---
     class statusRequest(core.actionObject):
         """Checks whether node is in bootloader or application mode and whether the node application firmware is valid.""" 
@@ -572,6 +591,7 @@ class gestaltVirtualNode(baseGestaltVirtualNode):
                 receivedData = self.getPacket()
                 status = receivedData['status']
                 appValid = (receivedData['appValidity'] == 170)
+                self.virtualNode._statusCache_ = (time.monotonic(), status, appValid)    #store for cachedStatusRequest
                 return status, appValid
             else:
                 notice(self.virtualNode, "Unable to check status.")
@@ -593,6 +613,7 @@ class gestaltVirtualNode(baseGestaltVirtualNode):
             Returns True if successful, or False if unsuccessful.
             """
             
+            self.virtualNode._statusCache_ = None   #node mode is about to change
             commandSet = {'startBootloader': 0, 'startApplication': 1}    #command options and corresponding firmware-defined values to send to node.
             responseSet = {'bootloaderStarted':5, 'applicationStarted':9 }    #response options and corresponding firmware-defined values received from node.
             if command in commandSet:   #provided command is valid
@@ -635,6 +656,7 @@ class gestaltVirtualNode(baseGestaltVirtualNode):
             
             Returns True if successful, False if unsuccessful.
             """
+            self.virtualNode._statusCache_ = None   #application validity may change
             self.setPacket(commandCode = 2, pageNumber = pageNumber, writeData = data)
             if self.transmitUntilResponse():  #transmit to the physical node, with multiple attempts until a reply is received. Default timeout and # of attempts.
                 returnPacket = self.getPacket()
@@ -650,8 +672,7 @@ class gestaltVirtualNode(baseGestaltVirtualNode):
         def synthetic(self, commandCode, pageNumber, writeData):
             """Synthetic node service routine handler for bootWriteRequest."""
             if commandCode == 2:    #write page command
-                for offset, dataByte in enumerate(writeData):
-                    self.virtualNode.synApplicationMemory[pageNumber+offset] = dataByte
+                self.virtualNode.synApplicationMemory[pageNumber:pageNumber+len(writeData)] = bytes(writeData) #copy the whole page at once
                 return {'responseCode': 1, 'pageNumber': pageNumber}
             else:
                 return False
@@ -675,7 +696,7 @@ class gestaltVirtualNode(baseGestaltVirtualNode):
         
         def synthetic(self, pageNumber):
             """Synthetic node service routine handler for bootReadRequest."""
-            readData = self.virtualNode.synApplicationMemory[pageNumber:pageNumber+self.virtualNode.bootPageSize]
+            readData = list(self.virtualNode.synApplicationMemory[pageNumber:pageNumber+self.virtualNode.bootPageSize]) #packets are encoded from lists of bytes
             return {'readData':readData}
         
     
@@ -731,10 +752,18 @@ class gestaltVirtualNode(baseGestaltVirtualNode):
     
     class identifyRequest(core.actionObject):
         """Requests that the node identify itself by blinking its LED."""
-        def init(self):
-            """Initialization function for identifyRequest."""
+        def init(self, blocking = True):
+            """Initialization function for identifyRequest.
+            
+            blocking -- if True (default), waits until the node has finished blinking before returning. If False, returns immediately.
+            
+            Returns True if blocking, or otherwise a threading.Event that is set once the node has finished blinking. This makes it
+            possible to identify several nodes at once, and then wait on all of them.
+            """
             self.transmit() #transmit request to node. No response is expected.
-            time.sleep(4) #roughly the time that the LED is on.
+            blinkDone = utilities.delayedEvent(4) #roughly the time that the LED is on.
+            if not blocking: return blinkDone
+            blinkDone.wait()
             return True
         
         def synthetic(self):
@@ -762,10 +791,18 @@ class gestaltVirtualNode(baseGestaltVirtualNode):
 
     class resetRequest(core.actionObject):
         """Requests that the node resets itself."""
-        def init(self):
-            """Initialization function for resetRequest."""
+        def init(self, blocking = True):
+            """Initialization function for resetRequest.
+            
+            blocking -- if True (default), waits for the node to reset before returning. If False, returns immediately.
+            
+            Returns True if blocking, or otherwise a threading.Event that is set once the node has had time to reset.
+            """
+            self.virtualNode._statusCache_ = None   #node will restart
             self.transmit() #transmit reqeuest to node. No response is expected.
-            time.sleep(0.1) #give tiem for the watchdog timer to reset.
+            resetDone = utilities.delayedEvent(0.1) #give tiem for the watchdog timer to reset.
+            if not blocking: return resetDone
+            resetDone.wait()
             return True
         
         def synthetic(self):
@@ -879,6 +916,8 @@ class nodeShell(object):
         For this reason, all shell attributes are underscored.
         """
         
+        self._cachedAttributes_ = []   #names of virtual node attributes that __getattr__ has cached in the shell's __dict__
+        
         #Extract parameters from keyword arguments.
         if "filename" in kwargs:
             self._sourceFilename_ = kwargs.pop("filename")      #NOTE: all shell attributes should be underscored according to note above.
@@ -921,6 +960,7 @@ class nodeShell(object):
         
         virtualNode -- the node to load into the shell
         """
+        self._clearAttributeCache_()    #cached attributes belong to the previous virtual node
         self._virtualNode_ = virtualNode    #store reference to virtual node
         if '_name_' in self.__dict__:   #removes the shell's temporary name, so that the attribute request maps onto the node.
             self.__dict__.pop('_name_')
@@ -950,6 +990,7 @@ class nodeShell(object):
         
         returns the loaded virtual node
         """
+        import imp
         
         try:
             self._setNodeLoaded_()    #pre-mark as node loaded, because this gets checked by new node on instantiation.
@@ -974,6 +1015,8 @@ class nodeShell(object):
         The reason for only writing to the original filename after a successful load is to prevent overwriting a good virtual node
         file with a 404 reply or some such garbage from a server.
         """
+        import urllib.request
+        
         try:
             vnFilename = os.path.basename(URL)
             urllib.request.urlretrieve(URL, "temporaryURLNode.py")  #retrieve file from URL
@@ -988,6 +1031,7 @@ class nodeShell(object):
             notice(self, "Could not load " + str(vnFilename) + " from " + URL)
             notice(self, "Error: " + str(error))
             notice(self, "Attempting to load virtual node from the local directory...")
+            self._clearAttributeCache_()
             self._virtualNode_ = False #unable to load node
             return self._loadNodeFromFile_(vnFilename, args, kwargs)
     
@@ -1021,7 +1065,13 @@ class nodeShell(object):
         """
         if self._virtualNode_:  #shell contains a valid virtual node
             if hasattr(self._virtualNode_, attribute):  #check to make sure virtual node has the requested attribute
-                return getattr(self._virtualNode_, attribute)   #return the attribute of the virtual node
+                value = getattr(self._virtualNode_, attribute)   #get the attribute of the virtual node
+                #actionObject classes and methods don't change for the life of the virtual node, so they are cached in the shell's __dict__,
+                #where later lookups find them without calling __getattr__. Other attributes may change, so are always forwarded.
+                if isinstance(value, type) or getattr(value, '__self__', None) is self._virtualNode_:
+                    self.__dict__[attribute] = value
+                    self._cachedAttributes_.append(attribute)
+                return value
             else:   #virtual node doesn't have the requested attribute
                 notice(self, "Node doesn't have the requested attribute")
                 raise AttributeError(attribute)
@@ -1030,6 +1080,12 @@ class nodeShell(object):
             raise AttributeError(attribute)
             
     
+    def _clearAttributeCache_(self):
+        """Removes any virtual node attributes cached in the shell's __dict__ by __getattr__."""
+        for attribute in self._cachedAttributes_:
+            self.__dict__.pop(attribute, None)
+        self._cachedAttributes_ = []
+    
     def _shellInit_(self, *args, **kwargs):
         """Dummy init function for shell.
         
@@ -1040,7 +1096,7 @@ class gestaltNodeShell(nodeShell):
     """The base node shell for gestalt-based nodes."""
     def _shellInit_(self, *args, **kwargs):
         if not self._virtualNode_: #no virtual node was provided, so use a default gestalt node
-            self._virtualNode_ = gestaltVirtualNode(*args, **kwargs)
+            self._setNodeInShell_(gestaltVirtualNode(*args, **kwargs))
 
 class soloGestaltNode(gestaltNodeShell):
     """The node shell type for solo (non-networked) gestalt nodes.
@@ -1050,7 +1106,7 @@ class soloGestaltNode(gestaltNodeShell):
     """
     def _shellInit_(self, *args, **kwargs):
         if not self._virtualNode_: #no virtual node was provided, so use a default gestalt node
-            self._virtualNode_ = soloGestaltVirtualNode(*args, **kwargs)    
+            self._setNodeInShell_(soloGestaltVirtualNode(*args, **kwargs))
 
 class networkedGestaltNode(gestaltNodeShell):
     """The node shell type for networked gestalt nodes.
@@ -1066,7 +1122,7 @@ class networkedGestaltNode(gestaltNodeShell):
         to be a networkedGestaltVirtualNode.
         """
         if not self._virtualNode_: #no virtual node was provided, so use a default gestalt node
-            self._virtualNode_ = networkedGestaltVirtualNode(*args, **kwargs)
+            self._setNodeInShell_(networkedGestaltVirtualNode(*args, **kwargs))
                 
 class arduinoGestaltNode(gestaltNodeShell):
     """The node shell type for arduino-based gestalt nodes.
@@ -1077,7 +1133,7 @@ class arduinoGestaltNode(gestaltNodeShell):
     """
     def _shellInit_(self, *args, **kwargs):
         if not self._virtualNode_: #no virtual node was provided, so use a default gestalt node
-            self._virtualNode_ = arduinoGestaltVirtualNode(*args, **kwargs)  
+            self._setNodeInShell_(arduinoGestaltVirtualNode(*args, **kwargs))
 
 
 #---- COMPOUND NODES ----  
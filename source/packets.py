@@ -16,10 +16,13 @@ class serializedPacket(list):
     def __init__(self, value = [], template = None):
         """Initialize a new packet.
         
-        value -- an input list, or packet. Note that any meta-data such as template of an input packet will be lost.
+        value -- an input list, packet, or bytearray. Note that any meta-data such as template of an input packet will be lost.
         template -- the template used to generate this packet. Useful for updating etc...
         """
-        list.__init__(self, utilities.flattenList(value))
+        if isinstance(value, (bytes, bytearray)):   #already flat, so copy directly
+            list.__init__(self, value)
+        else:
+            list.__init__(self, utilities.flattenList(value))
         self.template = template
     
     def toString(self):
@@ -48,6 +48,7 @@ class unit(object):
         self.fullName = fullName
         self.baseUnit = baseUnit
         self.conversion = conversion
+        self._reciprocal_ = None #cached result of reciprocal()
 
         if baseUnit and conversion == None: #check that a conversion factor was also provided.
             raise errors.UnitError("No conversion scaling factor was provided between " + abbreviation + " and base unit " + baseUnit.abbreviation)
@@ -207,6 +208,15 @@ class unit(object):
 
         return new_unit       
     
+    def reciprocal(self):
+        """Returns a unit equivalent to the inverse of this unit.
+        
+        This is the same as self**-1, but the result is cached on the unit so that repeated inversions don't derive a new unit each time.
+        """
+        if self._reciprocal_ == None: #not yet derived
+            self._reciprocal_ = self**-1
+        return self._reciprocal_
+
 
     def _getUnitDictAndValue(self, arg):
         """Returns the unit dictionary and value for the provided argument.
@@ -567,6 +577,10 @@ class dFloat(float):
         value = float(self)**float(power)
         newUnits = self.units ** power
         return dFloat(value, newUnits)
+    
+    def reciprocal(self):
+        """Returns the inverse of this dFloat, equivalent to self**-1."""
+        return dFloat(1.0/float(self), self.units.reciprocal())
 
 #-- STANDARD UNITS --
 
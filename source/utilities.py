@@ -9,9 +9,12 @@ import ast
 import datetime
 import itertools
 import sys
+import threading
 from pygestalt import config
 
 
+_mroFunctionCache_ = {} #(class, functionName, parentToChild):tuple of functions, as collected by callFunctionAcrossMRO
+
 def callFunctionAcrossMRO(instance, functionName, args = (), kwargs = {}, parentToChild = True):
     """Calls a function on all classes in instance's method resolution order.
     
@@ -22,17 +25,23 @@ def callFunctionAcrossMRO(instance, functionName, args = (), kwargs = {}, parent
     parentToChild -- affects the order in which base classes are called. If true, will walk up derived classes from basest base class.
     
     This function is particularly useful in initialiation routines where the same function must be called across multiple derived classes.
+    The functions found for each class are cached, so the method resolution order is only walked the first time a class is encountered.
     
     Note that this only currently works with functions that do not return anything.
     """
-    
-    mro = instance.__class__.mro()  #grab the MRO from the instance
-    if parentToChild:
-        mro.reverse()   #need to reverse MRO so iterates up derived class chain
-        
-    for thisClass in mro:   #iterate over classes in method resolution order
-        if functionName in thisClass.__dict__:  #check to make sure class has function defined in __dict__. This prevents calling a base class's method multiple times.
-            thisClass.__dict__[functionName](instance, *args, **kwargs)   #call class function on instance with provided arguments
+    instanceClass = instance.__class__
+    cacheKey = (instanceClass, functionName, parentToChild)
+    mroFunctions = _mroFunctionCache_.get(cacheKey)
+    if mroFunctions == None: #first call for this class, so walk the MRO
+        mro = instanceClass.mro()  #grab the MRO from the instance
+        if parentToChild:
+            mro.reverse()   #need to reverse MRO so iterates up derived class chain
+        #only functions defined in each class's own __dict__ are collected. This prevents calling a base class's method multiple times.
+        mroFunctions = tuple(thisClass.__dict__[functionName] for thisClass in mro if functionName in thisClass.__dict__)
+        _mroFunctionCache_[cacheKey] = mroFunctions
+        
+    for mroFunction in mroFunctions:
+        mroFunction(instance, *args, **kwargs)   #call class function on instance with provided arguments
 
 
 def objectIdentifier(callingObject):
@@ -74,6 +83,15 @@ def printToTerminal(text, newLine = True):
         sys.stdout.write(text)
         sys.stdout.flush()
 
+def debugEnabled(channel):
+    """Returns True if global verbose debug is enabled and the provided channel is enabled.
+    
+    channel -- a string channel name, as used by debugNotice
+    
+    Useful for skipping the construction of debug strings in time-critical code when nothing would be printed.
+    """
+    return config.verboseDebug() and config.debugChannelEnabled(channel)
+
 def debugNotice(callingObject, channel, noticeString, padding = False, newLine = True):
     """If global verbose debug is enabled, this function will print a formatted notice in the terminal window or alternate target.
     
@@ -87,10 +105,11 @@ def debugNotice(callingObject, channel, noticeString, padding = False, newLine =
         comm -- messages related to communications. Mostly coming from the interfaces module.
         units -- messages related to dimensionality of numbers
         persistence -- messages related to virtual machine persistence
+        mechanics -- messages related to mismatched transformer dimensions
     
     Returns True if notice was printed (verbose debug is enabled), or False otherwise
     """
-    if config.verboseDebug() and config.debugChannelEnabled(channel):
+    if debugEnabled(channel):
         if padding: print("")
         if callingObject == None:
             printToTerminal(str(noticeString), newLine)
@@ -102,6 +121,21 @@ def debugNotice(callingObject, channel, noticeString, padding = False, newLine =
     else:
         return False
 
+def delayedEvent(delay):
+    """Returns an event that will be set once a delay has elapsed.
+    
+    delay -- the time in seconds after which the event is set
+    
+    This lets a caller start several timed waits without blocking, and then call wait() on the returned threading.Event
+    objects only once it actually needs them to have finished.
+    """
+    event = threading.Event()
+    timer = threading.Timer(delay, event.set)
+    timer.daemon = True #don't hold up interpreter exit
+    timer.start()
+    return event
+
+
 def generatePersistenceManager(inputArgument, namespace = None):
     """Generates a persistence manager base on an input argument.
     
@@ -377,12 +411,11 @@ class CRC():
         """
         #INITIALIZE CRC ALGORITHM
         crc = 0
-        crcByte = 0
+        crcTable = self.crcTable    #local reference avoids an attribute lookup per byte
         
         #CALCULATE CRC
         for byte in byteList:
-            crcByte = byte^crc
-            crc = self.crcTable[crcByte]
+            crc = crcTable[byte^crc]
         return crc
     
     def validate(self, byteList, checkCRC):